@@ -24,31 +24,67 @@ Usage:
 import sys
 import os
 import re
+import stat
+import time
+import hashlib
+import itertools
+import asyncio
 import logging
+from dataclasses import dataclass
+from enum import Enum
 from pathlib import Path
-from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from urllib.parse import urlparse
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Add the scripts directory to path for proper imports
-SCRIPT_DIR = Path(__file__).parent.parent / "scripts"
-sys.path.insert(0, str(SCRIPT_DIR))
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add the scripts directory and project root to path for proper imports
+# (idempotent, so re-imports under reload don't keep growing sys.path)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT_DIR = os.path.join(PROJECT_ROOT, "scripts")
+for _path in (SCRIPT_DIR, PROJECT_ROOT):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
 # Change working directory for consistent paths
-os.chdir(Path(__file__).parent.parent)
+os.chdir(PROJECT_ROOT)
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, Response
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
-# Import citation resolution from scripts
+# Optional: faster JSON serialization for API responses
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as DefaultJSONResponse
+    HAS_ORJSON = True
+except ImportError:
+    import json
+    from fastapi.responses import JSONResponse as DefaultJSONResponse
+    HAS_ORJSON = False
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize an object to compact JSON bytes, using orjson when available."""
+    if HAS_ORJSON:
+        # No option flags: sorting or indenting would only cost cycles here
+        return orjson.dumps(obj)
+    # Match orjson's compact UTF-8 output so bodies and ETags are identical
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+# Import citation resolution, fetching and parsing from scripts.
+# Keep this import closure lean: document extraction (PyMuPDF, python-docx,
+# spaCy) happens client-side and must not be imported at module level here.
 from public_resolve import resolve_citation_to_urls
+from fetch_url import fetch_and_cache_url
+from parse_authority import parse_authority_document
+from utils.cache_helpers import TTLCache, ensure_cache_dir, read_citation_cache, write_citation_cache
+from utils.http_helpers import get_session
 
 # Optional: for proxy fetching
 try:
@@ -60,6 +96,20 @@ except ImportError:
 
 # ===== Pydantic Models =====
 
+class ResolutionStatus(str, Enum):
+    """Outcome of resolving a citation to URL(s)."""
+    RESOLVED = "resolved"
+    NOT_FOUND = "not_found"
+
+
+class SourceType(str, Enum):
+    """Where a resolved citation's judgment came from."""
+    BAILII = "bailii"
+    FIND_CASE_LAW = "find_case_law"
+    UNKNOWN = "unknown"
+    NOT_FOUND = "not_found"
+
+
 class CitationSearchItem(BaseModel):
     """A citation string to search for."""
     citation: str
@@ -76,7 +126,7 @@ class ResolvedUrl(BaseModel):
     citation: str
     case_name: Optional[str] = None
     urls: List[Dict[str, Any]] = []
-    status: str  # 'resolved', 'not_found'
+    status: ResolutionStatus
     error: Optional[str] = None
 
 
@@ -119,7 +169,7 @@ class ResolvedCitation(BaseModel):
     """Citation with resolved judgment data - backward compatible"""
     citation: str
     case_name: Optional[str] = None
-    source_type: str
+    source_type: SourceType
     url: Optional[str] = None
     title: Optional[str] = None
     paragraphs: List[Dict[str, Any]] = []
@@ -132,57 +182,288 @@ class CitationResolveResponse(BaseModel):
     summary: Dict[str, int]
 
 
+# Maximum citations resolved concurrently within one request
+RESOLVE_CONCURRENCY = 10
+
+# How long a resolved citation is reused across requests (default 7 days)
+CITATION_CACHE_TTL_SEC = float(os.environ.get("CITATION_CACHE_TTL_SEC", 7 * 24 * 3600))
+
+# How long an in-process URL resolution is reused (default 1 day)
+RESOLVE_URLS_TTL_SEC = float(os.environ.get("RESOLVE_URLS_TTL_SEC", 24 * 3600))
+
+# (citation, case_name, web_search) -> resolve_citation_to_urls result
+_RESOLVE_URLS_CACHE = TTLCache(maxsize=4096, ttl_sec=RESOLVE_URLS_TTL_SEC)
+
+# How long a /api/check-urls result for a URL is reused (default 1 hour)
+URL_CHECK_TTL_SEC = float(os.environ.get("URL_CHECK_TTL_SEC", 3600))
+
+# url -> UrlCheckResult; transient failures are never stored
+_URL_CHECK_CACHE = TTLCache(maxsize=8192, ttl_sec=URL_CHECK_TTL_SEC)
+
+# Maximum URLs checked concurrently within one request
+URL_CHECK_CONCURRENCY = 10
+
+# Worker threads in the app-wide default executor for blocking network calls
+IO_WORKERS = 32
+
+# Per-process sequence for job ids; next() on a count is atomic under the GIL
+_job_counter = itertools.count()
+
+
+def _new_job_id(prefix: str = "api") -> str:
+    """Return a unique job id without reading from the OS entropy pool."""
+    # pid keeps ids distinct across uvicorn workers sharing the cache directory
+    return f"{prefix}_{time.time_ns():x}_{os.getpid():x}_{next(_job_counter):x}"
+
+
+@dataclass(frozen=True, slots=True)
+class CitationContext:
+    """Internal work item for the legacy resolve endpoint."""
+    citation: str
+    case_name: Optional[str] = None
+
+
+# ===== Health Response =====
+
+# The health payload never changes, so serialize it once at import
+_HEALTH_BODY = _dumps({
+    "status": "healthy",
+    "name": "Citation Auditor Proxy",
+    "version": "0.3.0",
+    "privacy": "No document content is processed. Only citation strings and public URLs."
+})
+_HEALTH_ETAG = '"' + hashlib.sha256(_HEALTH_BODY).hexdigest()[:16] + '"'
+_HEALTH_HEADERS = {
+    "ETag": _HEALTH_ETAG,
+    "Cache-Control": "no-cache",
+}
+
+# Raw ASGI header lists for the short-circuit middleware below
+_HEALTH_ETAG_BYTES = _HEALTH_ETAG.encode("latin-1")
+_HEALTH_RAW_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_HEALTH_BODY)).encode("latin-1")),
+] + [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in _HEALTH_HEADERS.items()]
+_HEALTH_RAW_NOT_MODIFIED_HEADERS = _HEALTH_RAW_HEADERS[2:]
+
+
+class HealthShortCircuitMiddleware:
+    """Answer GET /health from precomputed bytes before routing runs."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] != "/health" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        status, headers, body = 200, _HEALTH_RAW_HEADERS, _HEALTH_BODY
+        for name, value in scope["headers"]:
+            if name == b"if-none-match" and value == _HEALTH_ETAG_BYTES:
+                status, headers, body = 304, _HEALTH_RAW_NOT_MODIFIED_HEADERS, b""
+                break
+
+        # Outer middleware (CORS) may append to the header list, so send a copy
+        await send({"type": "http.response.start", "status": status, "headers": list(headers)})
+        await send({"type": "http.response.body", "body": body})
+
+
 # ===== App Setup =====
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Install one warm thread pool as the loop's default executor for the app's lifetime."""
+    executor = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="citation-io")
+    asyncio.get_running_loop().set_default_executor(executor)
+    app.state.executor = executor
+    try:
+        yield
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 app = FastAPI(
     title="Citation Auditor Proxy",
     description="Minimal CORS proxy for legal citation resolution. No document content is processed.",
-    version="0.3.0"
+    version="0.3.0",
+    default_response_class=DefaultJSONResponse,
+    lifespan=lifespan,
 )
 
+# Health checks skip routing entirely; added first so CORS still wraps it
+app.add_middleware(HealthShortCircuitMiddleware)
+
 # CORS - allow all origins (this is a public proxy for public data)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["Content-Type"],
+    max_age=86400,
 )
 
 # NO AUTH - removed password protection. This is a public tool.
 
 # Static directory path for frontend files
-STATIC_DIR = Path(__file__).parent.parent / "static"
+STATIC_DIR = Path(PROJECT_ROOT) / "static"
 
 # Mount assets directory if it exists
 if STATIC_DIR.exists() and (STATIC_DIR / "assets").exists():
+    from fastapi.staticfiles import StaticFiles
     app.mount("/assets", StaticFiles(directory=STATIC_DIR / "assets"), name="assets")
 
 
 # ===== Allowed URL domains for proxy =====
-ALLOWED_PROXY_DOMAINS = [
+# Exact hostnames only (hash lookup); subdomains are deliberately not allowed
+ALLOWED_PROXY_DOMAINS = frozenset({
     "www.bailii.org",
     "bailii.org",
     "caselaw.nationalarchives.gov.uk",
-]
+})
+
+
+# Static proxy error bodies, serialized once
+_DOMAIN_NOT_ALLOWED_BODY = _dumps({
+    "detail": "URL domain not allowed. Only BAILII and Find Case Law URLs are permitted."
+})
+_NO_HTTP_CLIENT_BODY = _dumps({"detail": "HTTP client not available"})
+# Clients don't retry these on the same connection, so don't hold it open
+_CLOSE_HEADERS = {"Connection": "close"}
+
+# Outbound request headers; requests copies them when merging, so one dict is shared
+_UPSTREAM_HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
+
+# Body bytes read when validating a URL; indicators, title and FRBRname sit near the top
+CHECK_URL_MAX_BYTES = 256 * 1024
+
+# Largest upstream body proxy-fetch will relay (default 20 MB)
+PROXY_MAX_BYTES = int(os.environ.get("PROXY_MAX_BYTES", 20 * 1024 * 1024))
+
+# Read size when streaming upstream bodies
+_STREAM_CHUNK_BYTES = 64 * 1024
+
+# Legal terms expected on a real BAILII judgment page (matched on lowercased text)
+BAILII_LEGAL_INDICATORS = (
+    "judgment", "court", "justice", "appeal", "claimant",
+    "defendant", "respondent", "appellant", "held", "ordered",
+    "lordship", "honour", "tribunal", "act",
+)
+
+# Minimum page text length by host; an uncompressed Content-Length below it
+# (bytes are never fewer than characters) marks a stub page
+_MIN_PAGE_CHARS_BY_HOST = {
+    "www.bailii.org": 3000,
+    "bailii.org": 3000,
+    "caselaw.nationalarchives.gov.uk": 5000,
+}
+
+# HEAD answers that settle a page is gone; anything unexpected falls back to GET
+_HEAD_GONE_STATUSES = frozenset({404, 410})
+
+# Page <title>; searched with an endpos so the page head is never sliced out
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
+# Akoma Ntoso work name, the title fallback for FCL XML
+_FRBR_NAME_RE = re.compile(r'<FRBRname\s+value="([^"]+)"')
+
+# Case-insensitive page checks, run on the decoded page without lowercasing a copy
+_LEGAL_INDICATOR_RE = re.compile("|".join(map(re.escape, BAILII_LEGAL_INDICATORS)), re.IGNORECASE)
+_ERROR_PAGE_RE = re.compile(r"page not found|error 404", re.IGNORECASE)
+_PAGE_NOT_FOUND_RE = re.compile(r"page not found", re.IGNORECASE)
+_AKN_DOCUMENT_RE = re.compile(r"<akomantoso|<frbrwork", re.IGNORECASE)
+
+# Distinct legal indicators a BAILII page needs to count as a judgment
+MIN_LEGAL_INDICATORS = 3
+
+# Words too common in case names to identify a party
+PARTY_STOP_WORDS = frozenset({
+    'r', 'v', 'the', 'and', 'of', 'for', 'in', 'on', 'a', 'an',
+    'secretary', 'state', 'home', 'department', 'commissioner',
+    'council', 'borough', 'county', 'city', 'district',
+})
 
 
 def is_allowed_proxy_url(url: str) -> bool:
     """Check if a URL is allowed for proxying (only legal databases)."""
     try:
-        from urllib.parse import urlparse
         parsed = urlparse(url)
         return parsed.hostname in ALLOWED_PROXY_DOMAINS
     except Exception:
         return False
 
 
+# A bracketed four-digit year, e.g. "[2015]"
+_YEAR_BRACKET_RE = re.compile(r"\[\d{4}\]")
+
+# Case-name normalization steps for verify_case_name_match, applied in order
+_REVISION_SUFFIX_RE = re.compile(r'\s*\(rev\s*\d*\)\s*$')
+_BRACKETED_RE = re.compile(r'\s*\[.*?\]\s*')
+_VERSUS_RE = re.compile(r'\s+v\.?\s+')
+_COMPANY_SUFFIX_RE = re.compile(r'\s+(plc|ltd|limited|inc|llc|llp)\b')
+_PARTY_WORD_RE = re.compile(r'\b[a-z]{3,}\b')
+
+
+def fetch_text_capped(
+    url: str, timeout: float, max_bytes: int, read_error_body: bool = False
+) -> Tuple[Any, str, bool]:
+    """
+    GET a URL and decode at most max_bytes of its body.
+
+    The body is streamed, so a huge page never sits in memory in full. Non-200
+    bodies are skipped unless read_error_body is set. Returns (response, text, truncated).
+    """
+    with get_session().get(
+        url, timeout=timeout, headers=_UPSTREAM_HEADERS, allow_redirects=True, stream=True,
+    ) as resp:
+        if resp.status_code != 200 and not read_error_body:
+            return resp, "", False
+
+        buf = bytearray()
+        for chunk in resp.iter_content(chunk_size=_STREAM_CHUNK_BYTES):
+            buf += chunk
+            if len(buf) > max_bytes:
+                break
+        truncated = len(buf) > max_bytes
+        if truncated:
+            del buf[max_bytes:]
+
+        try:
+            text = buf.decode(resp.encoding or "utf-8", errors="replace")
+        except LookupError:
+            # Unknown charset label from the server
+            text = buf.decode("utf-8", errors="replace")
+        return resp, text, truncated
+
+
+def resolve_citation_to_urls_cached(
+    citation_text: str, case_name: Optional[str], enable_web_search: bool = False
+) -> Dict[str, Any]:
+    """Resolve a citation to candidate URLs, reusing a recent successful resolution."""
+    # Whitespace differences don't change the lookup; case does (case names are matched on it)
+    key = (" ".join(citation_text.split()), case_name or "", enable_web_search)
+    resolution = _RESOLVE_URLS_CACHE.get(key)
+    if resolution is None:
+        resolution = resolve_citation_to_urls(
+            citation_text=citation_text,
+            case_name=case_name,
+            enable_web_search=enable_web_search,
+        )
+        # Failures may be transient (timeouts, rate limits), so only successes are kept
+        if resolution and resolution.get("resolution_status") == "resolved":
+            _RESOLVE_URLS_CACHE.set(key, resolution)
+    return resolution
+
+
 def extract_case_name_from_citation(citation_text: str) -> Optional[str]:
     """Extract case name from a citation string like 'Montgomery v Lanarkshire [2015] UKSC 11'."""
-    match = re.match(r'^(.*?)\s*\[\d{4}\]', citation_text.strip())
+    # Find the first "[YYYY]" and take everything before it - a linear scan,
+    # where a lazy ^(.*?) prefix would retry the bracket match at every position
+    match = _YEAR_BRACKET_RE.search(citation_text)
     if match:
-        name = match.group(1).strip()
-        if name and len(name) > 2:
+        name = citation_text[:match.start()].strip()
+        if len(name) > 2:
             return name
     return None
 
@@ -197,11 +478,11 @@ def verify_case_name_match(claimed_name: str, actual_name: str) -> bool:
 
     def normalize(name: str) -> str:
         name = name.lower().strip()
-        name = re.sub(r'\s*\(rev\s*\d*\)\s*$', '', name)
-        name = re.sub(r'\s*\[.*?\]\s*', ' ', name)
-        name = re.sub(r'\s+v\.?\s+', ' v ', name)
-        name = re.sub(r'\s+(plc|ltd|limited|inc|llc|llp)\b', '', name)
-        name = re.sub(r'\s+', ' ', name).strip()
+        name = _REVISION_SUFFIX_RE.sub('', name)
+        name = _BRACKETED_RE.sub(' ', name)
+        name = _VERSUS_RE.sub(' v ', name)
+        name = _COMPANY_SUFFIX_RE.sub('', name)
+        name = " ".join(name.split())
         return name
 
     norm_claimed = normalize(claimed_name)
@@ -213,11 +494,9 @@ def verify_case_name_match(claimed_name: str, actual_name: str) -> bool:
         return True
 
     def extract_parties(name: str) -> set:
-        stop_words = {'r', 'v', 'the', 'and', 'of', 'for', 'in', 'on', 'a', 'an',
-                      'secretary', 'state', 'home', 'department', 'commissioner',
-                      'council', 'borough', 'county', 'city', 'district'}
-        words = set(re.findall(r'\b[a-z]{3,}\b', name.lower()))
-        return words - stop_words
+        # Names arrive already lowercased by normalize()
+        words = set(_PARTY_WORD_RE.findall(name))
+        return words - PARTY_STOP_WORDS
 
     claimed_parties = extract_parties(norm_claimed)
     actual_parties = extract_parties(norm_actual)
@@ -267,9 +546,6 @@ async def check_urls_exist(request: BatchCheckRequest):
     just to check if they return 200 (case exists) or 404 (not found).
     Minimal traffic - HEAD requests only, no content fetched.
     """
-    import asyncio
-    from concurrent.futures import ThreadPoolExecutor
-
     def check_single_url(url: str) -> UrlCheckResult:
         if not is_allowed_proxy_url(url):
             return UrlCheckResult(url=url, exists=False, status_code=403)
@@ -278,76 +554,111 @@ async def check_urls_exist(request: BatchCheckRequest):
             return UrlCheckResult(url=url, exists=False, status_code=500)
 
         try:
-            # Full GET to validate content (BAILII returns 200 even for non-existent cases)
-            resp = http_requests.get(
-                url, timeout=12,
-                headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"},
-                allow_redirects=True,
-            )
+            # Cheap HEAD first: a missing page or a stub too small to be a
+            # judgment is rejected without downloading the body. Hosts that
+            # mishandle HEAD (timeout, reset) just fall through to the GET
+            try:
+                head = get_session().head(url, timeout=5, headers=_UPSTREAM_HEADERS, allow_redirects=True)
+            except http_requests.RequestException as e:
+                logger.debug("HEAD failed for %s, falling back to GET: %s", url, e)
+                head = None
+            if head is not None:
+                if head.status_code in _HEAD_GONE_STATUSES:
+                    return UrlCheckResult(url=url, exists=False, status_code=head.status_code)
+                if head.status_code == 200 and not url.endswith(".xml"):
+                    min_chars = _MIN_PAGE_CHARS_BY_HOST.get(urlparse(url).hostname)
+                    length = head.headers.get("content-length")
+                    # A compressed length says nothing about the decoded text size
+                    if (min_chars and length and length.isdigit()
+                            and head.headers.get("content-encoding", "identity") == "identity"
+                            and int(length) < min_chars):
+                        return UrlCheckResult(url=url, exists=False, status_code=404)
+
+            # GET to validate content (BAILII returns 200 even for non-existent cases);
+            # only the head of the page is needed, so the read is capped
+            resp, content, _ = fetch_text_capped(url, 12, CHECK_URL_MAX_BYTES)
 
             if resp.status_code != 200:
                 return UrlCheckResult(url=url, exists=False, status_code=resp.status_code)
 
-            content = resp.text
-            lower = content.lower()
-
             # Check for error/not-found/redirect pages
-            if "page not found" in lower[:1000] or "error 404" in lower[:1000]:
+            # Bounded search scans the page head without copying it
+            if _ERROR_PAGE_RE.search(content, 0, 1000):
                 return UrlCheckResult(url=url, exists=False, status_code=404)
 
             # BAILII: check for actual case content (BAILII returns 200 for empty/stub pages)
             if "bailii.org" in url:
-                # Real BAILII case pages have judgment text - check for legal indicators
-                legal_indicators = ["judgment", "court", "justice", "appeal", "claimant",
-                                    "defendant", "respondent", "appellant", "held", "ordered",
-                                    "lordship", "honour", "tribunal", "act"]
-                matches = sum(1 for ind in legal_indicators if ind in lower)
-                # Also check content length - real judgments are substantial
-                if matches < 3 or len(content) < 3000:
+                # Real judgments are substantial - the cheap length check goes first
+                if len(content) < 3000:
+                    return UrlCheckResult(url=url, exists=False, status_code=404)
+                # Real BAILII case pages have judgment text - check for legal
+                # indicators in one pass, stopping once enough distinct ones are seen
+                found = set()
+                for match in _LEGAL_INDICATOR_RE.finditer(content):
+                    found.add(match.group().lower())
+                    if len(found) >= MIN_LEGAL_INDICATORS:
+                        break
+                if len(found) < MIN_LEGAL_INDICATORS:
                     return UrlCheckResult(url=url, exists=False, status_code=404)
 
             # FCL XML: check for Akoma Ntoso structure
             if url.endswith(".xml"):
-                if "<akomantoso" not in lower and "<frbrwork" not in lower:
+                if not _AKN_DOCUMENT_RE.search(content):
                     return UrlCheckResult(url=url, exists=False, status_code=404)
 
             # FCL HTML: check for real case content (not "Page not found")
             if "caselaw.nationalarchives.gov.uk" in url and not url.endswith(".xml"):
-                if "page not found" in lower[:2000]:
+                if _PAGE_NOT_FOUND_RE.search(content, 0, 2000):
                     return UrlCheckResult(url=url, exists=False, status_code=404)
                 if len(content) < 5000:
                     return UrlCheckResult(url=url, exists=False, status_code=404)
 
             # Extract title
             title = None
-            import re as re_mod
-            title_match = re_mod.search(r"<title[^>]*>(.*?)</title>", content[:5000], re_mod.IGNORECASE | re_mod.DOTALL)
+            title_match = _TITLE_RE.search(content, 0, 5000)
             if title_match:
                 title = title_match.group(1).strip()[:200]
             # FCL: try FRBRname
             if not title and "<FRBRname" in content:
-                name_match = re_mod.search(r'<FRBRname\s+value="([^"]+)"', content)
+                name_match = _FRBR_NAME_RE.search(content)
                 if name_match:
                     title = name_match.group(1).strip()[:200]
 
             return UrlCheckResult(url=url, exists=True, status_code=200, title=title)
 
         except Exception as e:
-            logger.debug(f"URL check failed for {url}: {e}")
+            logger.debug("URL check failed for %s: %s", url, e)
             return UrlCheckResult(url=url, exists=False, status_code=0)
 
-    # Run checks in parallel (max 10 concurrent)
-    loop = asyncio.get_event_loop()
-    max_workers = min(len(request.urls), 10)
+    # URLs checked recently are answered from the cache without a network trip
+    results = [_URL_CHECK_CACHE.get(url) for url in request.urls]
+    misses = [i for i, result in enumerate(results) if result is None]
+
+    if misses:
+        # Run checks in parallel on the app's shared executor, bounded per request
+        semaphore = asyncio.Semaphore(URL_CHECK_CONCURRENCY)
+        loop = asyncio.get_running_loop()
+
+        async def check_one(url: str) -> UrlCheckResult:
+            async with semaphore:
+                return await loop.run_in_executor(None, check_single_url, url)
+
+        # A batch often repeats a URL (e.g. BAILII and FCL candidates for the
+        # same case); fetch each distinct one once and share the result
+        unique_urls = list(dict.fromkeys(request.urls[i] for i in misses))
+        checked = await asyncio.gather(*(check_one(url) for url in unique_urls))
+        checked_by_url = dict(zip(unique_urls, checked))
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [
-            loop.run_in_executor(executor, check_single_url, url)
-            for url in request.urls
-        ]
-        results = await asyncio.gather(*futures)
+        for url, result in checked_by_url.items():
+            # status 0 (network error), 429 and 5xx say nothing lasting about the URL
+            if result.status_code != 0 and result.status_code != 429 and result.status_code < 500:
+                _URL_CHECK_CACHE.set(url, result)
 
-    return BatchCheckResponse(results=list(results))
+        for i in misses:
+            results[i] = checked_by_url[request.urls[i]]
+
+    response = BatchCheckResponse.model_construct(results=results)
+    return DefaultJSONResponse(content=response.model_dump(mode="json"))
 
 
 @app.post("/api/proxy-fetch", response_model=ProxyFetchResponse)
@@ -362,36 +673,41 @@ async def proxy_fetch(request: ProxyFetchRequest):
     are permitted.
     """
     if not HAS_REQUESTS:
-        raise HTTPException(status_code=500, detail="HTTP client not available")
+        return Response(
+            content=_NO_HTTP_CLIENT_BODY, status_code=500,
+            media_type="application/json", headers=_CLOSE_HEADERS,
+        )
 
     url = request.url.strip()
 
     if not is_allowed_proxy_url(url):
-        raise HTTPException(
-            status_code=403,
-            detail=f"URL domain not allowed. Only BAILII and Find Case Law URLs are permitted."
+        return Response(
+            content=_DOMAIN_NOT_ALLOWED_BODY, status_code=403,
+            media_type="application/json", headers=_CLOSE_HEADERS,
         )
 
     try:
-        response = http_requests.get(
-            url,
-            timeout=15,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            },
-            allow_redirects=True
+        # Blocking I/O - run in a worker thread so the event loop stays free
+        response, content, truncated = await asyncio.to_thread(
+            fetch_text_capped, url, 15, PROXY_MAX_BYTES, True
         )
+        if truncated:
+            raise HTTPException(status_code=502, detail="Upstream response too large")
 
         content_type = response.headers.get("content-type", "text/html")
 
-        return ProxyFetchResponse(
-            url=url,
-            status_code=response.status_code,
-            content_type=content_type,
-            content=response.text,
-            ok=response.status_code == 200
-        )
-
+        # Page bodies can be hundreds of KB; serialize the ProxyFetchResponse
+        # shape straight to JSON instead of re-validating it through the model
+        return DefaultJSONResponse(content={
+            "url": url,
+            "status_code": response.status_code,
+            "content_type": content_type,
+            "content": content,
+            "ok": response.status_code == 200,
+        })
+
+    except HTTPException:
+        raise
     except http_requests.exceptions.Timeout:
         raise HTTPException(status_code=504, detail="Upstream request timed out")
     except http_requests.exceptions.ConnectionError:
@@ -410,63 +726,73 @@ async def resolve_citation_urls(request: CitationSearchRequest):
 
     Returns only URLs - the browser fetches and parses judgment content itself.
     """
-    results = []
+    # Each resolution blocks on BAILII/FCL; run them side by side on the app's
+    # default executor, bounded per request, keeping the input order
+    semaphore = asyncio.Semaphore(RESOLVE_CONCURRENCY)
+    loop = asyncio.get_running_loop()
 
-    for item in request.citations:
-        citation_text = item.citation.strip()
-        if not citation_text:
-            continue
-
-        case_name = item.case_name or extract_case_name_from_citation(citation_text)
-
-        try:
-            resolution = resolve_citation_to_urls(
-                citation_text=citation_text,
-                case_name=case_name,
-            )
-
-            if resolution.get("resolution_status") == "resolved" and resolution.get("candidate_urls"):
-                urls = []
-                for candidate in resolution["candidate_urls"]:
-                    urls.append({
-                        "url": candidate.get("url"),
-                        "source": candidate.get("source", "unknown"),
-                        "confidence": candidate.get("confidence", 0),
-                        "title": candidate.get("title"),
-                    })
-
-                results.append(ResolvedUrl(
-                    citation=citation_text,
-                    case_name=resolution.get("case_name") or case_name,
-                    urls=urls,
-                    status="resolved",
-                ))
-            else:
-                results.append(ResolvedUrl(
-                    citation=citation_text,
-                    case_name=case_name,
-                    urls=[],
-                    status="not_found",
-                    error="Citation could not be resolved to a URL"
-                ))
+    async def resolve_one(item: CitationSearchItem) -> ResolvedUrl:
+        async with semaphore:
+            return await loop.run_in_executor(None, _resolve_one_url, item)
 
-        except Exception as e:
-            logger.error(f"Error resolving {citation_text}: {e}")
-            results.append(ResolvedUrl(
-                citation=citation_text,
-                case_name=case_name,
-                urls=[],
-                status="not_found",
-                error=str(e)
-            ))
+    results = await asyncio.gather(
+        *(resolve_one(item) for item in request.citations if item.citation.strip())
+    )
 
-    found = sum(1 for r in results if r.status == "resolved")
+    found = sum(1 for r in results if r.status is ResolutionStatus.RESOLVED)
     not_found = len(results) - found
 
-    return CitationSearchResponse(
+    # Each ResolvedUrl was validated when it was built; skip re-validating
+    # the response model and serialize straight to JSON bytes
+    response = CitationSearchResponse.model_construct(
         resolved=results,
         summary={"total": len(results), "found": found, "not_found": not_found}
     )
+    return DefaultJSONResponse(content=response.model_dump(mode="json"))
+
+
+def _resolve_one_url(item: CitationSearchItem) -> ResolvedUrl:
+    """Resolve one citation string to candidate URLs (blocking)."""
+    citation_text = item.citation.strip()
+    case_name = item.case_name or extract_case_name_from_citation(citation_text)
+
+    try:
+        resolution = resolve_citation_to_urls_cached(citation_text, case_name)
+
+        if resolution.get("resolution_status") == "resolved" and resolution.get("candidate_urls"):
+            urls = []
+            for candidate in resolution["candidate_urls"]:
+                urls.append({
+                    "url": candidate.get("url"),
+                    "source": candidate.get("source", "unknown"),
+                    "confidence": candidate.get("confidence", 0),
+                    "title": candidate.get("title"),
+                })
+
+            return ResolvedUrl(
+                citation=citation_text,
+                case_name=resolution.get("case_name") or case_name,
+                urls=urls,
+                status=ResolutionStatus.RESOLVED,
+            )
+
+        return ResolvedUrl(
+            citation=citation_text,
+            case_name=case_name,
+            urls=[],
+            status=ResolutionStatus.NOT_FOUND,
+            error="Citation could not be resolved to a URL"
+        )
+
+    except Exception as e:
+        logger.error(f"Error resolving {citation_text}: {e}")
+        return ResolvedUrl(
+            citation=citation_text,
+            case_name=case_name,
+            urls=[],
+            status=ResolutionStatus.NOT_FOUND,
+            error=str(e)
+        )
 
 
 # ===== BACKWARD-COMPATIBLE ENDPOINT =====
@@ -481,28 +807,22 @@ async def resolve_citations_legacy(request: CitationResolveRequest):
     PRIVACY: Only citation strings and case names are processed.
     No document content is sent to this endpoint.
     """
-    import asyncio
-    from concurrent.futures import ThreadPoolExecutor
-
     # Build unified list of citations with context
     citations_to_process = []
 
     if request.citations_with_context:
         for ctx in request.citations_with_context:
-            citations_to_process.append({
-                "citation": ctx.citation.strip(),
-                "case_name": ctx.case_name,
-            })
+            citations_to_process.append(CitationContext(ctx.citation.strip(), ctx.case_name))
 
+    seen_citations = {c.citation for c in citations_to_process}
     for citation_text in request.citations:
         citation_text = citation_text.strip()
         if citation_text:
-            existing = [c["citation"] for c in citations_to_process]
-            if citation_text not in existing:
-                citations_to_process.append({
-                    "citation": citation_text,
-                    "case_name": extract_case_name_from_citation(citation_text),
-                })
+            if citation_text not in seen_citations:
+                seen_citations.add(citation_text)
+                citations_to_process.append(CitationContext(
+                    citation_text, extract_case_name_from_citation(citation_text)
+                ))
 
     num_citations = len(citations_to_process)
     logger.info(f"Resolving {num_citations} citations (privacy mode - no document content)")
@@ -513,59 +833,86 @@ async def resolve_citations_legacy(request: CitationResolveRequest):
             summary={"total": 0, "found": 0, "not_found": 0}
         )
 
-    max_workers = min(num_citations, 10)
+    # Bound in-flight resolutions per request; the resolvers are blocking, so
+    # they run on the app's default executor rather than a pool built per request
+    semaphore = asyncio.Semaphore(RESOLVE_CONCURRENCY)
+    loop = asyncio.get_running_loop()
 
-    loop = asyncio.get_event_loop()
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [
-            loop.run_in_executor(
-                executor,
-                _resolve_single_citation,
-                ctx,
-                request.web_search_enabled
+    async def resolve_one(ctx: CitationContext) -> ResolvedCitation:
+        async with semaphore:
+            return await loop.run_in_executor(
+                None, _resolve_single_citation, ctx, request.web_search_enabled
             )
-            for ctx in citations_to_process
-        ]
-        resolved_citations = await asyncio.gather(*futures)
 
-    found = sum(1 for r in resolved_citations if r.source_type != "not_found")
+    # The same citation can arrive several times with identical context (e.g.
+    # cited in several claims); resolve each distinct one once, then expand
+    # back so the response keeps one entry per input in the original order
+    unique_contexts = list(dict.fromkeys(citations_to_process))
+    unique_results = await asyncio.gather(
+        *(resolve_one(ctx) for ctx in unique_contexts)
+    )
+    results_by_context = dict(zip(unique_contexts, unique_results))
+    resolved_citations = [results_by_context[ctx] for ctx in citations_to_process]
+
+    found = sum(1 for r in resolved_citations if r.source_type is not SourceType.NOT_FOUND)
     not_found = len(resolved_citations) - found
 
-    return CitationResolveResponse(
-        resolved=list(resolved_citations),
+    # Each ResolvedCitation was validated when it was built; assemble the
+    # response without re-validating (and re-copying) every paragraph list
+    response = CitationResolveResponse.model_construct(
+        resolved=resolved_citations,
         summary={"total": num_citations, "found": found, "not_found": not_found}
     )
+    return DefaultJSONResponse(content=response.model_dump(mode="json"))
+
+
+def _resolve_single_citation(ctx: CitationContext, web_search_enabled: bool) -> ResolvedCitation:
+    """Resolve a single citation, reusing a recent result from the on-disk cache."""
+    if not ctx.citation:
+        return ResolvedCitation(citation="", source_type=SourceType.NOT_FOUND, error="Empty citation")
+
+    cache_key = f"{ctx.citation}\x1f{ctx.case_name or ''}\x1f{int(web_search_enabled)}"
+    cached = read_citation_cache(cache_key, CITATION_CACHE_TTL_SEC)
+    if cached is not None:
+        try:
+            return ResolvedCitation.model_validate(cached)
+        except ValidationError as e:
+            # Corrupt or written by an older schema - treat as a miss
+            logger.debug("Ignoring cached resolution for %s: %s", ctx.citation, e)
+
+    resolved, fetched = _resolve_citation_uncached(ctx, web_search_enabled)
 
+    # Only cache when the judgment was actually fetched and parsed; timeouts
+    # and fetch/parse errors may be transient
+    if fetched:
+        try:
+            write_citation_cache(cache_key, resolved.model_dump(mode="json"))
+        except OSError as e:
+            logger.warning(f"Could not cache resolution for {ctx.citation}: {e}")
 
-def _resolve_single_citation(ctx: dict, web_search_enabled: bool) -> ResolvedCitation:
-    """Resolve a single citation. Used for parallel processing."""
-    from utils.cache_helpers import ensure_cache_dir
-    from fetch_url import fetch_and_cache_url
-    from parse_authority import parse_authority_document
-    import uuid
+    return resolved
 
-    citation_text = ctx["citation"]
-    if not citation_text:
-        return ResolvedCitation(citation="", source_type="not_found", error="Empty citation")
 
-    case_name = ctx.get("case_name") or extract_case_name_from_citation(citation_text)
+def _resolve_citation_uncached(
+    ctx: CitationContext, web_search_enabled: bool
+) -> Tuple[ResolvedCitation, bool]:
+    """Resolve, fetch and parse a single citation; the flag says whether the fetch and parse succeeded."""
+    citation_text = ctx.citation
+    case_name = ctx.case_name or extract_case_name_from_citation(citation_text)
 
     try:
-        resolution = resolve_citation_to_urls(
-            citation_text=citation_text,
-            case_name=case_name,
-            enable_web_search=web_search_enabled
-        )
+        resolution = resolve_citation_to_urls_cached(citation_text, case_name, web_search_enabled)
 
         if resolution and resolution.get("resolution_status") == "resolved" and resolution.get("candidate_urls"):
             candidate = resolution["candidate_urls"][0]
             url = candidate["url"]
-            source_type = candidate.get("source", "unknown")
+            source_type = SourceType(candidate.get("source", SourceType.UNKNOWN))
             title = resolution.get("case_name") or case_name
 
             paragraphs = []
+            fetched = False
             try:
-                job_id = f"resolve_{uuid.uuid4().hex[:8]}"
+                job_id = _new_job_id("resolve")
                 ensure_cache_dir(job_id)
 
                 fetch_result = fetch_and_cache_url(job_id=job_id, url=url)
@@ -586,21 +933,24 @@ def _resolve_single_citation(ctx: dict, web_search_enabled: bool) -> ResolvedCit
                                 return ResolvedCitation(
                                     citation=citation_text,
                                     case_name=case_name,
-                                    source_type="not_found",
+                                    source_type=SourceType.NOT_FOUND,
                                     error=f"Case name mismatch: document is '{actual_title}', not '{case_name}'"
-                                )
+                                ), False
                             title = actual_title
 
                         if parsed.get("paragraphs"):
+                            # Look each paragraph's text up once, and only build
+                            # a fallback number when the parser didn't supply one
                             paragraphs = [
                                 {
-                                    "para_num": p.get("para_num", str(i+1)),
-                                    "text": p.get("text", ""),
+                                    "para_num": p["para_num"] if "para_num" in p else str(i + 1),
+                                    "text": text,
                                     "speaker": p.get("speaker")
                                 }
                                 for i, p in enumerate(parsed["paragraphs"])
-                                if p.get("text") and len(p.get("text", "")) > 20
+                                if len(text := p.get("text") or "") > 20
                             ]
+                        fetched = True
 
             except Exception as e:
                 logger.error(f"Error fetching/parsing {url}: {e}")
@@ -612,69 +962,96 @@ def _resolve_single_citation(ctx: dict, web_search_enabled: bool) -> ResolvedCit
                 url=url,
                 title=title,
                 paragraphs=paragraphs
-            )
+            ), fetched
 
         else:
             return ResolvedCitation(
                 citation=citation_text,
                 case_name=case_name,
-                source_type="not_found",
+                source_type=SourceType.NOT_FOUND,
                 error="Citation could not be resolved to a URL"
-            )
+            ), False
 
     except Exception as e:
         logger.error(f"Error resolving {citation_text}: {e}")
         return ResolvedCitation(
             citation=citation_text,
             case_name=case_name,
-            source_type="not_found",
+            source_type=SourceType.NOT_FOUND,
             error=str(e)
-        )
+        ), False
 
 
 # ===== Health & Static Serving =====
 
+_STATUS_BODY = _dumps({
+    "name": "Citation Auditor Proxy",
+    "status": "online",
+    "version": "0.3.0"
+})
+_NOT_FOUND_BODY = _dumps({"detail": "Not found"})
+
+# Response header sets, built once and shared by every response
+_NO_CACHE_HEADERS = {"Cache-Control": "no-cache, no-store, must-revalidate"}
+_IMMUTABLE_HEADERS = {"Cache-Control": "public, max-age=31536000, immutable"}
+
+# Vite/Rollup content hash before the extension, e.g. "index-B3x_k9Qa.js"
+_HASHED_ASSET_RE = re.compile(r"-[A-Za-z0-9_-]{8}\.[A-Za-z0-9]+$")
+
+
 @app.get("/health")
-async def health_check():
-    """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "name": "Citation Auditor Proxy",
-        "version": "0.3.0",
-        "privacy": "No document content is processed. Only citation strings and public URLs."
-    }
+async def health_check(request: Request):
+    """Health check endpoint (normally answered by HealthShortCircuitMiddleware)."""
+    if request.headers.get("if-none-match") == _HEALTH_ETAG:
+        return Response(status_code=304, headers=_HEALTH_HEADERS)
+    return Response(content=_HEALTH_BODY, media_type="application/json", headers=_HEALTH_HEADERS)
+
+
+def _stat_regular_file(path: Path) -> Optional[os.stat_result]:
+    """Stat a path once; return the result only if it is a regular file."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st if stat.S_ISREG(st.st_mode) else None
 
 
 if STATIC_DIR.exists():
+    INDEX_PATH = STATIC_DIR / "index.html"
+
+    # Each handler stats a file once and hands the result to FileResponse,
+    # which would otherwise stat it again before sending
+
     @app.get("/")
     async def serve_frontend():
         """Serve the frontend index.html."""
-        index_path = STATIC_DIR / "index.html"
-        if index_path.exists():
-            return FileResponse(index_path, headers={"Cache-Control": "no-cache, no-store, must-revalidate"})
-        return {"name": "Citation Auditor Proxy", "status": "online", "version": "0.3.0"}
+        index_stat = _stat_regular_file(INDEX_PATH)
+        if index_stat is not None:
+            return FileResponse(INDEX_PATH, headers=_NO_CACHE_HEADERS, stat_result=index_stat)
+        return Response(content=_STATUS_BODY, media_type="application/json")
 
     @app.get("/{path:path}")
     async def serve_static(path: str):
         """Serve static files or fall back to index.html for SPA routing."""
         if path.startswith("api/") or path == "health":
-            raise HTTPException(status_code=404, detail="Not found")
+            return Response(content=_NOT_FOUND_BODY, status_code=404, media_type="application/json")
 
         file_path = STATIC_DIR / path
-        if file_path.exists() and file_path.is_file():
-            if "/assets/" in path and any(c.isdigit() for c in path):
-                headers = {"Cache-Control": "public, max-age=31536000, immutable"}
+        file_stat = _stat_regular_file(file_path)
+        if file_stat is not None:
+            if "/assets/" in path and _HASHED_ASSET_RE.search(path):
+                headers = _IMMUTABLE_HEADERS
             else:
-                headers = {"Cache-Control": "no-cache, no-store, must-revalidate"}
-            return FileResponse(file_path, headers=headers)
+                headers = _NO_CACHE_HEADERS
+            return FileResponse(file_path, headers=headers, stat_result=file_stat)
 
-        index_path = STATIC_DIR / "index.html"
-        if index_path.exists():
-            return FileResponse(index_path, headers={"Cache-Control": "no-cache, no-store, must-revalidate"})
+        index_stat = _stat_regular_file(INDEX_PATH)
+        if index_stat is not None:
+            return FileResponse(INDEX_PATH, headers=_NO_CACHE_HEADERS, stat_result=index_stat)
 
-        raise HTTPException(status_code=404, detail="Not found")
+        return Response(content=_NOT_FOUND_BODY, status_code=404, media_type="application/json")
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(app, host="0.0.0.0", port=8000, timeout_keep_alive=65)
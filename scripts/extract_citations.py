@@ -14,7 +14,7 @@ import sys
 import re
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 
 from utils.cache_helpers import write_cache_json, read_cache_json
 
@@ -28,6 +28,14 @@ CITATION_PATTERNS = {
     "year_volume_report": r"\((\d{4})\)\s+(\d+)\s+(WLR|AC|QB|Ch|Fam|All ER)\s+(\d+)",
 }
 
+# All default patterns unioned into one alternation, each wrapped in a named
+# group so a single scan reports which pattern matched (match.lastgroup).
+# The default patterns never match overlapping text, so one pass finds the
+# same citations as scanning the document once per pattern.
+CITATION_RE = re.compile(
+    "|".join(f"(?P<{name}>{regex})" for name, regex in CITATION_PATTERNS.items())
+)
+
 
 def extract_citations_from_text(
     text: str, patterns: Optional[Dict[str, str]] = None
@@ -42,25 +50,21 @@ def extract_citations_from_text(
     Returns:
         List of citation objects with metadata
     """
-    if patterns is None:
-        patterns = CITATION_PATTERNS
-
     citations = []
     citation_id_counter = 1
 
-    for pattern_name, pattern_regex in patterns.items():
-        for match in re.finditer(pattern_regex, text):
-            citation = {
-                "citation_id": f"cit_{citation_id_counter}",
-                "text": match.group(0),
-                "start_pos": match.start(),
-                "end_pos": match.end(),
-                "pattern_matched": pattern_name,
-                "confidence": calculate_confidence(pattern_name, match.group(0)),
-            }
-
-            citations.append(citation)
-            citation_id_counter += 1
+    for pattern_name, match in _iter_pattern_matches(text, patterns):
+        citation = {
+            "citation_id": f"cit_{citation_id_counter}",
+            "text": match.group(0),
+            "start_pos": match.start(),
+            "end_pos": match.end(),
+            "pattern_matched": pattern_name,
+            "confidence": calculate_confidence(pattern_name, match.group(0)),
+        }
+
+        citations.append(citation)
+        citation_id_counter += 1
 
     # Sort by position in document
     citations.sort(key=lambda c: c["start_pos"])
@@ -72,6 +76,30 @@ def extract_citations_from_text(
     return citations
 
 
+def _iter_pattern_matches(
+    text: str, patterns: Optional[Dict[str, str]] = None
+) -> Iterator[Tuple[str, "re.Match[str]"]]:
+    """
+    Yield (pattern_name, match) pairs for every citation match in text.
+
+    Args:
+        text: Document text to scan
+        patterns: Optional custom regex patterns (default: single CITATION_RE pass)
+
+    Yields:
+        Tuples of pattern name and regex match
+    """
+    if patterns is None:
+        for match in CITATION_RE.finditer(text):
+            yield match.lastgroup, match
+        return
+
+    # Custom patterns may overlap, so scan for each one separately
+    for pattern_name, pattern_regex in patterns.items():
+        for match in re.finditer(pattern_regex, text):
+            yield pattern_name, match
+
+
 def calculate_confidence(pattern_name: str, citation_text: str) -> float:
     """
     Calculate confidence score for citation match.
@@ -13,7 +13,8 @@ import argparse
 import sys
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Iterator, Tuple
 
 # PyMuPDF for PDF extraction
 try:
@@ -21,11 +22,26 @@ try:
 except ImportError:
     fitz = None
 
-# BeautifulSoup for HTML extraction
+# lxml for HTML extraction
 try:
-    from bs4 import BeautifulSoup
+    import lxml.html as lxml_html
+    from lxml import etree as lxml_etree
 except ImportError:
-    BeautifulSoup = None
+    lxml_html = None
+    lxml_etree = None
+
+# Documents larger than this are rejected before any parsing (50 MB)
+MAX_DOCUMENT_BYTES = 50 * 1024 * 1024
+
+# Elements whose text is never document content
+HTML_SKIP_TAGS = frozenset({"script", "style"})
+HTML_TEXT_NODES = lxml_etree.XPath("//text()") if lxml_etree is not None else None
+
+# Extracted documents kept in memory. Each entry holds a document's full
+# text, so this stays small; it only pays off when the module is imported
+# and the same file is extracted again in one process (the orchestrator
+# runs this script in a fresh subprocess per document)
+EXTRACT_CACHE_SIZE = 4
 
 from utils.cache_helpers import write_cache_json
 from utils.file_helpers import safe_read_text
@@ -33,6 +49,34 @@ from utils.validation import validate_document_type
 from utils.hash_helpers import sha256_file
 
 
+def iter_pdf_pages(doc_path: Path) -> Iterator[Tuple[int, str]]:
+    """
+    Lazily yield the plain text of each PDF page.
+
+    Only one page's text is held at a time, so callers that can work page by
+    page never materialize the whole document. The document is closed when
+    iteration finishes or the generator is discarded.
+
+    Args:
+        doc_path: Path to PDF file
+
+    Yields:
+        Tuples of 1-based page number and page text
+
+    Raises:
+        ImportError: If PyMuPDF not installed
+    """
+    if fitz is None:
+        raise ImportError("PyMuPDF (fitz) not installed. Install with: pip install PyMuPDF")
+
+    doc = fitz.open(doc_path)
+    try:
+        for page in doc:
+            yield page.number + 1, page.get_text("text")
+    finally:
+        doc.close()
+
+
 def extract_text_from_pdf(doc_path: Path) -> Dict[str, Any]:
     """
     Extract text from PDF using PyMuPDF.
@@ -51,19 +95,14 @@ def extract_text_from_pdf(doc_path: Path) -> Dict[str, Any]:
         raise ImportError("PyMuPDF (fitz) not installed. Install with: pip install PyMuPDF")
 
     try:
-        doc = fitz.open(doc_path)
-
-        # Extract text from all pages
+        # Extract plain text from all pages, skipping blank ones
+        page_count = 0
         text_parts = []
-        for page_num, page in enumerate(doc, 1):
-            page_text = page.get_text()
+        for page_count, page_text in iter_pdf_pages(doc_path):
             if page_text.strip():
                 text_parts.append(page_text)
 
         full_text = "\n\n".join(text_parts)
-        page_count = len(doc)
-
-        doc.close()
 
         return {
             "text": full_text,
@@ -78,7 +117,10 @@ def extract_text_from_pdf(doc_path: Path) -> Dict[str, Any]:
 
 def extract_text_from_html(doc_path: Path) -> Dict[str, Any]:
     """
-    Extract text from HTML using BeautifulSoup.
+    Extract text from HTML using lxml.
+
+    Text nodes are read straight off the parsed tree, skipping script,
+    style and comment content, without building a BeautifulSoup tree on top.
 
     Args:
         doc_path: Path to HTML file
@@ -87,33 +129,43 @@ def extract_text_from_html(doc_path: Path) -> Dict[str, Any]:
         dict with text and metadata
 
     Raises:
-        ImportError: If BeautifulSoup not installed
+        ImportError: If lxml not installed
         Exception: If HTML extraction fails
     """
-    if BeautifulSoup is None:
-        raise ImportError(
-            "BeautifulSoup not installed. Install with: pip install beautifulsoup4 lxml"
-        )
+    if lxml_html is None:
+        raise ImportError("lxml not installed. Install with: pip install lxml")
 
     try:
         html_content = safe_read_text(doc_path)
-        soup = BeautifulSoup(html_content, "lxml")
-
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-
-        # Get text
-        text = soup.get_text(separator="\n")
+        text = ""
 
-        # Clean up whitespace
-        lines = [line.strip() for line in text.splitlines()]
-        text = "\n".join(line for line in lines if line)
+        try:
+            # Parse as UTF-8 bytes so documents with an encoding declaration are accepted
+            root = lxml_html.document_fromstring(
+                html_content.encode("utf-8"),
+                parser=lxml_html.HTMLParser(encoding="utf-8"),
+            )
+        except lxml_etree.ParserError:
+            # Empty, whitespace-only or comment-only document
+            root = None
+
+        if root is not None:
+            # Text nodes in document order; comments are not text nodes, and
+            # script/style bodies are skipped while their tails are kept
+            parts = [
+                node
+                for node in HTML_TEXT_NODES(root)
+                if node.is_tail or node.getparent().tag not in HTML_SKIP_TAGS
+            ]
+
+            # Clean up whitespace
+            lines = (line.strip() for line in "\n".join(parts).splitlines())
+            text = "\n".join(line for line in lines if line)
 
         return {
             "text": text,
             "char_count": len(text),
-            "extraction_method": "beautifulsoup",
+            "extraction_method": "lxml",
         }
 
     except Exception as e:
@@ -151,6 +203,40 @@ def extract_text_from_txt(doc_path: Path) -> Dict[str, Any]:
         raise Exception(f"Text extraction failed: {e}") from e
 
 
+@lru_cache(maxsize=EXTRACT_CACHE_SIZE)
+def _extract_cached(doc_path: str, mtime_ns: int, size: int, doc_type: str) -> Dict[str, Any]:
+    """
+    Extract text and hash a document, memoized on its stat fingerprint.
+
+    Args:
+        doc_path: Path to document file
+        mtime_ns: File modification time in nanoseconds (cache key only)
+        size: File size in bytes (cache key only)
+        doc_type: Document type (pdf, html, txt)
+
+    Returns:
+        Extraction metadata including the source hash
+
+    Raises:
+        ValueError: If document type unsupported
+        Exception: If extraction fails
+    """
+    path = Path(doc_path)
+
+    # Extract based on type
+    if doc_type == "pdf":
+        metadata = extract_text_from_pdf(path)
+    elif doc_type == "html":
+        metadata = extract_text_from_html(path)
+    elif doc_type == "txt":
+        metadata = extract_text_from_txt(path)
+    else:
+        raise ValueError(f"Unsupported document type: {doc_type}")
+
+    metadata["source_hash"] = sha256_file(path)
+    return metadata
+
+
 def extract_text_from_document(
     job_id: str, doc_id: str, doc_path: Path, doc_type: str
 ) -> Dict[str, Any]:
@@ -168,7 +254,7 @@ def extract_text_from_document(
 
     Raises:
         FileNotFoundError: If document not found
-        ValueError: If document type unsupported
+        ValueError: If document type unsupported or document too large
         Exception: If extraction fails
     """
     # Validate inputs
@@ -176,18 +262,19 @@ def extract_text_from_document(
     if not validation:
         raise ValueError(f"Invalid document type: {', '.join(validation.errors)}")
 
-    if not doc_path.exists():
-        raise FileNotFoundError(f"Document not found: {doc_path}")
+    try:
+        stat = doc_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Document not found: {doc_path}") from None
 
-    # Extract based on type
-    if doc_type == "pdf":
-        metadata = extract_text_from_pdf(doc_path)
-    elif doc_type == "html":
-        metadata = extract_text_from_html(doc_path)
-    elif doc_type == "txt":
-        metadata = extract_text_from_txt(doc_path)
-    else:
-        raise ValueError(f"Unsupported document type: {doc_type}")
+    if stat.st_size > MAX_DOCUMENT_BYTES:
+        raise ValueError(
+            f"Document too large: {stat.st_size} bytes (limit {MAX_DOCUMENT_BYTES} bytes)"
+        )
+
+    # Unchanged files (same path, mtime and size) are served from the cache;
+    # copy the shared entry so callers can never mutate a later hit
+    metadata = dict(_extract_cached(str(doc_path), stat.st_mtime_ns, stat.st_size, doc_type))
 
     # Build result
     result = {
@@ -198,7 +285,7 @@ def extract_text_from_document(
         "metadata": {
             "char_count": metadata["char_count"],
             "extraction_method": metadata["extraction_method"],
-            "source_hash": sha256_file(doc_path),
+            "source_hash": metadata["source_hash"],
         },
     }
 
@@ -22,6 +22,7 @@ except ImportError:
 
 from utils.file_helpers import safe_write_json
 from utils.hash_helpers import sha256_bytes
+from utils.http_helpers import get_session
 from utils.validation import validate_url
 
 
@@ -95,7 +96,7 @@ def fetch_fcl_document_xml(
                 time.sleep(backoff)
 
             # Fetch
-            response = requests.get(
+            response = get_session().get(
                 url,
                 timeout=timeout_sec,
                 headers={"User-Agent": "HallucinationAuditor/0.2.0"},
@@ -22,6 +22,7 @@ except ImportError:
     requests = None
 
 from utils.file_helpers import safe_write_json
+from utils.http_helpers import get_session
 from utils.validation import validate_url
 
 
@@ -149,7 +150,7 @@ def search_fcl_atom(
 
     # Make request
     try:
-        response = requests.get(
+        response = get_session().get(
             FCL_ATOM_URL,
             params=params,
             timeout=timeout,
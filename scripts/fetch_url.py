@@ -16,11 +16,17 @@ Rate Limiting:
 """
 
 import argparse
+import hashlib
+import math
+import random
+import re
 import sys
+import tempfile
 import time
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional, Tuple
 from urllib.parse import urlparse
 
 try:
@@ -29,11 +35,22 @@ except ImportError:
     requests = None
 
 from utils.cache_helpers import ensure_sources_dir, get_sources_path
-from utils.file_helpers import safe_write_bytes, safe_write_json
-from utils.hash_helpers import sha256_bytes
+from utils.file_helpers import safe_write_json
+from utils.http_helpers import get_session
 from utils.validation import validate_url
 
 
+# Known source hosts; the matching group name is the source identifier
+SOURCE_HOST_RE = re.compile(
+    r"(?P<find_case_law>caselaw\.nationalarchives\.gov\.uk)|(?P<bailii>bailii\.org)"
+)
+
+# Longest Retry-After we are willing to honour before retrying (seconds)
+MAX_RETRY_AFTER_SEC = 60.0
+
+# Read size when streaming a response body to disk
+DOWNLOAD_CHUNK_BYTES = 1024 * 1024
+
 # Source-specific rate limiter state
 _last_fetch_by_source: Dict[str, float] = {}
 
@@ -55,15 +72,11 @@ def detect_source(url: str) -> str:
     Returns:
         Source identifier (find_case_law, bailii, or default)
     """
+    # urlparse already lowercases the hostname
     hostname = urlparse(url).hostname or ""
-    hostname = hostname.lower()
 
-    if "caselaw.nationalarchives.gov.uk" in hostname:
-        return "find_case_law"
-    elif "bailii.org" in hostname:
-        return "bailii"
-    else:
-        return "default"
+    host_match = SOURCE_HOST_RE.search(hostname)
+    return host_match.lastgroup if host_match else "default"
 
 
 def rate_limit_wait(url: str, rate_limit_ms: Optional[int] = None) -> None:
@@ -96,6 +109,81 @@ def rate_limit_wait(url: str, rate_limit_ms: Optional[int] = None) -> None:
     _last_fetch_by_source[source] = time.time()
 
 
+def backoff_delay(attempt: int, base_delay: float) -> float:
+    """
+    Exponential backoff with jitter.
+
+    Jitter keeps parallel workers that failed together from retrying in lockstep.
+
+    Args:
+        attempt: Zero-based retry attempt
+        base_delay: Delay for the first attempt in seconds
+
+    Returns:
+        Seconds to wait, between one and two exponential steps
+    """
+    step = base_delay * (2**attempt)
+    return step + random.uniform(0, step)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given as delta-seconds or an HTTP date.
+
+    Args:
+        value: Raw header value (None if absent)
+
+    Returns:
+        Seconds to wait, capped at MAX_RETRY_AFTER_SEC, or None if absent/invalid
+    """
+    if not value:
+        return None
+
+    try:
+        seconds = float(value)
+        if not math.isfinite(seconds):
+            return None
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER_SEC)
+
+
+def stream_response_to_file(response: Any, directory: Path) -> Tuple[Path, str, int]:
+    """
+    Stream a response body into a temp file, hashing it on the way.
+
+    Only one chunk is held in memory at a time, so large judgments never
+    exist as a single bytes object.
+
+    Args:
+        response: Streaming requests response (stream=True)
+        directory: Directory for the temp file (same filesystem as the cache)
+
+    Returns:
+        Tuple of temp file path, SHA256 hex digest and byte count
+    """
+    hasher = hashlib.sha256()
+    size = 0
+    with tempfile.NamedTemporaryFile(dir=directory, suffix=".part", delete=False) as tmp:
+        try:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_BYTES):
+                hasher.update(chunk)
+                tmp.write(chunk)
+                size += len(chunk)
+        except BaseException:
+            tmp.close()
+            Path(tmp.name).unlink(missing_ok=True)
+            raise
+    return Path(tmp.name), hasher.hexdigest(), size
+
+
 def fetch_and_cache_url(
     job_id: str,
     url: str,
@@ -131,7 +219,7 @@ def fetch_and_cache_url(
         raise ValueError(f"Invalid URL: {url}")
 
     # Ensure sources directory exists
-    ensure_sources_dir(job_id)
+    sources_dir = ensure_sources_dir(job_id)
 
     # Detect source for metadata
     source = detect_source(url)
@@ -146,17 +234,29 @@ def fetch_and_cache_url(
 
         for attempt in range(max_retries):
             try:
-                response = requests.get(
+                response = get_session().get(
                     url,
                     timeout=timeout_sec,
                     headers={"User-Agent": user_agent},
                     allow_redirects=True,
+                    stream=True,
                 )
 
                 # Check if successful
                 if response.status_code == 200:
+                    # Stream content to disk and compute hash in the same pass.
+                    # This stays inside the retry: a reset or read timeout
+                    # mid-body is retried like any other network error, and
+                    # stream_response_to_file removes the partial temp file
+                    with response:
+                        temp_path, content_hash, content_length = stream_response_to_file(
+                            response, sources_dir
+                        )
                     break
 
+                # Error bodies are never read; hand the connection back to the pool
+                response.close()
+
                 # Handle specific status codes
                 if response.status_code == 404:
                     return {
@@ -169,7 +269,10 @@ def fetch_and_cache_url(
 
                 if response.status_code == 429:  # Rate limit
                     if attempt < max_retries - 1:
-                        sleep_time = retry_delay * (2**attempt)
+                        # Honour the server's Retry-After when it gives one
+                        sleep_time = parse_retry_after(response.headers.get("Retry-After"))
+                        if sleep_time is None:
+                            sleep_time = backoff_delay(attempt, retry_delay)
                         print(f"[WAIT] Rate limited (429), waiting {sleep_time:.1f}s...")
                         time.sleep(sleep_time)
                         continue
@@ -186,7 +289,7 @@ def fetch_and_cache_url(
             except requests.Timeout:
                 if attempt < max_retries - 1:
                     print(f"[WAIT] Timeout, retrying ({attempt + 1}/{max_retries})...")
-                    time.sleep(retry_delay)
+                    time.sleep(backoff_delay(attempt, retry_delay))
                     continue
                 else:
                     return {
@@ -200,7 +303,7 @@ def fetch_and_cache_url(
             except requests.RequestException as e:
                 if attempt < max_retries - 1:
                     print(f"[WAIT] Network error, retrying ({attempt + 1}/{max_retries})...")
-                    time.sleep(retry_delay)
+                    time.sleep(backoff_delay(attempt, retry_delay))
                     continue
                 else:
                     return {
@@ -211,9 +314,8 @@ def fetch_and_cache_url(
                         "error": str(e),
                     }
 
-        # Get content and compute hash
-        content = response.content
-        content_hash = sha256_bytes(content)
+        # Timestamp the successful response once; both result shapes below use it
+        fetched_at = datetime.now(timezone.utc).isoformat()
 
         # Determine file extension from Content-Type
         content_type = response.headers.get("Content-Type", "text/html")
@@ -231,34 +333,35 @@ def fetch_and_cache_url(
         cache_path = get_sources_path(job_id, cache_filename)
 
         if cache_path.exists() and not force_refetch:
+            temp_path.unlink(missing_ok=True)
             print(f"[OK] Cached (deduped - already exists)")
             return {
                 "url": url,
-                "fetched_at": datetime.now(timezone.utc).isoformat(),
+                "fetched_at": fetched_at,
                 "status_code": response.status_code,
                 "content_hash": content_hash,
                 "cache_path": str(cache_path),
                 "fetch_status": "cached",
                 "metadata": {
                     "content_type": content_type,
-                    "content_length": len(content),
+                    "content_length": content_length,
                 },
             }
 
-        # Write content to cache
-        safe_write_bytes(cache_path, content)
+        # Move the fully written body into place atomically
+        temp_path.replace(cache_path)
 
         # Write metadata
         metadata = {
             "url": url,
             "source": source,
-            "fetched_at": datetime.now(timezone.utc).isoformat(),
+            "fetched_at": fetched_at,
             "status_code": response.status_code,
             "content_hash": content_hash,
             "cache_path": str(cache_path),
             "metadata": {
                 "content_type": content_type,
-                "content_length": len(content),
+                "content_length": content_length,
                 "headers": dict(response.headers),
                 "redirects": [r.url for r in response.history] if response.history else [],
             },
@@ -269,7 +372,7 @@ def fetch_and_cache_url(
         meta_path = cache_path.with_suffix(cache_path.suffix + ".meta.json")
         safe_write_json(meta_path, metadata)
 
-        print(f"[OK] Fetched ({len(content)} bytes)")
+        print(f"[OK] Fetched ({content_length} bytes)")
         print(f"  Cached: {cache_path}")
 
         return metadata
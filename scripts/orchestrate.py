@@ -16,45 +16,100 @@ Usage:
 """
 
 import argparse
+import os
 import sys
 import subprocess
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Tuple
 
 from utils.file_helpers import safe_read_json, safe_write_json
 from utils.cache_helpers import get_cache_path, ensure_cache_dir
 from utils.validation import validate_input_job
 
 
-def run_command(cmd: List[str], description: str) -> int:
+def run_command(cmd: List[str], description: str, log: Callable[[str], None] = print) -> int:
     """
     Run shell command and handle errors.
 
     Args:
         cmd: Command and arguments
         description: Human-readable description
+        log: Output function for progress lines (default: print)
 
     Returns:
         Exit code
     """
-    print(f"  -> {description}...")
+    log(f"  -> {description}...")
     result = subprocess.run(cmd, capture_output=True, text=True)
 
     if result.returncode != 0:
-        print(f"  X Failed: {result.stderr}")
+        log(f"  X Failed: {result.stderr}")
         return result.returncode
 
     # Print stdout if present
     if result.stdout:
         for line in result.stdout.strip().split('\n'):
             if line.strip():
-                print(f"     {line}")
+                log(f"     {line}")
 
     return 0
 
 
+def extract_document(
+    job_id: str, doc: Dict[str, Any], log: Callable[[str], None] = print
+) -> bool:
+    """
+    Extract text and then citations from a single document.
+
+    Args:
+        job_id: Job identifier
+        doc: Document entry from the input job
+        log: Output function for progress lines (default: print)
+
+    Returns:
+        True if successful
+    """
+    doc_id = doc["doc_id"]
+
+    cmd = [
+        "python", "scripts/extract_text.py",
+        "--job-id", job_id,
+        "--doc-id", doc_id,
+        "--doc-path", doc["path"],
+        "--doc-type", doc["type"],
+    ]
+
+    if run_command(cmd, f"Extract text from {doc_id}", log) != 0:
+        return False
+
+    cmd = [
+        "python", "scripts/extract_citations.py",
+        "--job-id", job_id,
+        "--doc-id", doc_id,
+        "--text-json", f"cache/{job_id}/{doc_id}.text.json",
+    ]
+
+    return run_command(cmd, f"Extract citations from {doc_id}", log) == 0
+
+
+def extract_document_buffered(job_id: str, doc: Dict[str, Any]) -> Tuple[bool, List[str]]:
+    """
+    Extract a document, collecting its progress lines instead of printing them.
+
+    Args:
+        job_id: Job identifier
+        doc: Document entry from the input job
+
+    Returns:
+        Tuple of success flag and the document's output lines
+    """
+    lines: List[str] = []
+    return extract_document(job_id, doc, lines.append), lines
+
+
 def phase1_extraction(job_id: str, input_data: Dict[str, Any]) -> bool:
     """
     Phase 1: Extract text, citations, and build claims.
@@ -68,36 +123,32 @@ def phase1_extraction(job_id: str, input_data: Dict[str, Any]) -> bool:
     """
     print("\n=== Phase 1: Extraction ===")
 
-    # Extract text from each document
-    for doc in input_data.get("documents", []):
-        doc_id = doc["doc_id"]
-        doc_path = doc["path"]
-        doc_type = doc["type"]
-
-        cmd = [
-            "python", "scripts/extract_text.py",
-            "--job-id", job_id,
-            "--doc-id", doc_id,
-            "--doc-path", doc_path,
-            "--doc-type", doc_type,
-        ]
-
-        if run_command(cmd, f"Extract text from {doc_id}") != 0:
-            return False
-
-    # Extract citations from each document
-    for doc in input_data.get("documents", []):
-        doc_id = doc["doc_id"]
-        text_json = f"cache/{job_id}/{doc_id}.text.json"
-
-        cmd = [
-            "python", "scripts/extract_citations.py",
-            "--job-id", job_id,
-            "--doc-id", doc_id,
-            "--text-json", text_json,
-        ]
-
-        if run_command(cmd, f"Extract citations from {doc_id}") != 0:
+    # Documents are independent, so run each one's extraction chain concurrently;
+    # the work happens in subprocesses, so threads are enough to overlap it
+    documents = input_data.get("documents", [])
+    if documents:
+        max_workers = min(len(documents), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(extract_document_buffered, job_id, doc) for doc in documents
+            ]
+            failed = False
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                ok, lines = future.result()
+                # Each document's output is printed as one block, so lines
+                # from concurrent documents never interleave
+                for line in lines:
+                    print(line)
+                if not ok and not failed:
+                    # Stop at the first failed document: documents not yet
+                    # started are cancelled, running ones finish and report
+                    failed = True
+                    for pending in futures:
+                        pending.cancel()
+
+        if failed:
             return False
 
     # Build canonical claims
@@ -224,33 +275,41 @@ def phase3_verification(job_id: str, input_data: Dict[str, Any]) -> bool:
     # Verify each claim-citation pair
     ensure_cache_dir(job_id, "verifications")
 
-    for claim in claims_data.get("claims", []):
-        claim_id = claim["claim_id"]
-        claim_text = claim["text"]
-
-        for citation in claim.get("citations", []):
-            citation_id = citation["citation_id"]
-            citation_text = citation["citation_text"]
-
-            # Find parsed authority for this citation
-            authorities_dir = Path("cache") / job_id / "authorities"
-            if authorities_dir.exists():
-                authority_files = list(authorities_dir.glob("*.parsed.json"))
-                if authority_files:
-                    # Use first authority (in real system, match by URL)
-                    authority_file = authority_files[0]
-
-                    output_path = get_cache_path(job_id, f"verifications/{claim_id}_{citation_id}.json")
-
-                    cmd = [
-                        "python", "scripts/verify_claim.py",
-                        "--claim-text", claim_text,
-                        "--citation-text", citation_text,
-                        "--authority-json", str(authority_file),
-                        "--output", str(output_path),
-                    ]
-
-                    run_command(cmd, f"Verify {claim_id} against authority")
+    # Find parsed authorities once; the set doesn't change per citation
+    authorities_dir = Path("cache") / job_id / "authorities"
+    authority_files = (
+        sorted(authorities_dir.glob("*.parsed.json")) if authorities_dir.exists() else []
+    )
+
+    verifications = []
+    if authority_files:
+        # Use first authority (in real system, match by URL)
+        authority_file = authority_files[0]
+
+        for claim in claims_data.get("claims", []):
+            claim_id = claim["claim_id"]
+            claim_text = claim["text"]
+
+            for citation in claim.get("citations", []):
+                citation_id = citation["citation_id"]
+                citation_text = citation["citation_text"]
+
+                output_path = get_cache_path(job_id, f"verifications/{claim_id}_{citation_id}.json")
+
+                cmd = [
+                    "python", "scripts/verify_claim.py",
+                    "--claim-text", claim_text,
+                    "--citation-text", citation_text,
+                    "--authority-json", str(authority_file),
+                    "--output", str(output_path),
+                ]
+                verifications.append((cmd, f"Verify {claim_id} against authority"))
+
+    # Each verification is an independent local subprocess, so run them concurrently
+    if verifications:
+        max_workers = min(len(verifications), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(lambda job: run_command(*job), verifications))
 
     # Generate simple reports
     generate_reports(job_id, input_data)
@@ -326,7 +385,7 @@ def generate_reports(job_id: str, input_data: Dict[str, Any]) -> None:
 
     # Write Markdown report
     md_path = reports_dir / f"{job_id}.md"
-    md_content = f"""# Hallucination Audit Report: {report['audit_metadata']['title']}
+    md_header = f"""# Hallucination Audit Report: {report['audit_metadata']['title']}
 
 **Job ID**: {job_id}
 **Audited**: {report['audit_metadata']['audited_at']}
@@ -341,12 +400,15 @@ def generate_reports(job_id: str, input_data: Dict[str, Any]) -> None:
 
 """
 
-    for claim in report["claims"]:
-        md_content += f"\n### Claim: {claim['text']}\n\n"
-        for citation in claim["citations"]:
-            md_content += f"- **{citation['citation_text']}**: {citation['outcome']}\n"
-
-    md_path.write_text(md_content, encoding='utf-8')
+    # Stream claims straight to the file instead of growing one string with +=
+    with open(md_path, "w", encoding="utf-8") as md_file:
+        md_file.write(md_header)
+        for claim in report["claims"]:
+            md_file.write(f"\n### Claim: {claim['text']}\n\n")
+            md_file.writelines(
+                f"- **{citation['citation_text']}**: {citation['outcome']}\n"
+                for citation in claim["citations"]
+            )
     print(f"     [OK] Markdown report: {md_path}")
 
 
@@ -14,6 +14,7 @@ Supported Sources:
 """
 
 import argparse
+import copy
 import sys
 import re
 import hashlib
@@ -27,8 +28,46 @@ try:
 except ImportError:
     BeautifulSoup = None
 
-from utils.cache_helpers import ensure_cache_dir
-from utils.file_helpers import safe_read_text, safe_write_json
+# lxml for plain-text fallback extraction
+try:
+    import lxml.html as lxml_html
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_html = None
+    lxml_etree = None
+
+from utils.cache_helpers import TTLCache, ensure_cache_dir
+from utils.file_helpers import safe_write_json
+
+
+# Recently parsed documents, keyed on a content digest rather than the text
+# itself. Each entry holds a whole parsed judgment, so this stays small; hits
+# only happen when one process parses the same document again
+PARSE_CACHE_SIZE = 4
+_PARSE_CACHE = TTLCache(maxsize=PARSE_CACHE_SIZE, ttl_sec=3600)
+
+# Common judgment start indicators, used to skip navigation/header content
+JUDGMENT_START_RE = re.compile(r"judgment|lord |the court|opinion", re.IGNORECASE)
+
+# Known source hosts; the matching group name is the parser to use
+SOURCE_HOST_RE = re.compile(
+    r"(?P<fcl_xml>caselaw\.nationalarchives\.gov\.uk)|(?P<bailii>bailii\.org)", re.IGNORECASE
+)
+
+# Neutral citation in a BAILII title, e.g. "[2015] UKSC 11" (groups: year, court, number)
+NEUTRAL_CITATION_RE = re.compile(r"\[(\d{4})\]\s+(\w+)\s+(\d+)")
+
+# BAILII numbered paragraph, e.g. "[12] The appellant..." (groups: number, text)
+BAILII_PARA_RE = re.compile(r"\[(\d+)\]\s+(.*)", re.DOTALL)
+
+# First run of digits in an FCL paragraph eId such as "para_12"
+PARA_ID_NUMBER_RE = re.compile(r"(\d+)")
+
+# Every text node in a parsed document (comments and PIs excluded)
+TEXT_NODES = lxml_etree.XPath("//text()") if lxml_etree is not None else None
+
+# Elements whose text is never document content
+SKIP_TEXT_TAGS = frozenset({"script", "style"})
 
 
 def parse_bailii_html(html_content: str) -> Dict[str, Any]:
@@ -55,7 +94,7 @@ def parse_bailii_html(html_content: str) -> Dict[str, Any]:
 
     # Try to extract neutral citation from title
     neutral_citation = None
-    citation_match = re.search(r"\[(\d{4})\]\s+(\w+)\s+(\d+)", title)
+    citation_match = NEUTRAL_CITATION_RE.search(title)
     if citation_match:
         neutral_citation = citation_match.group(0)
 
@@ -68,10 +107,9 @@ def parse_bailii_html(html_content: str) -> Dict[str, Any]:
 
     # Extract court and date from title or content
     court = None
-    if neutral_citation:
-        court_match = re.search(r"\[(\d{4})\]\s+(\w+)", neutral_citation)
-        if court_match:
-            court = court_match.group(2)
+    if citation_match:
+        # The court abbreviation is already captured by the citation match
+        court = citation_match.group(2)
 
     # Extract paragraphs - try numbered [N] format first
     paragraphs = []
@@ -80,8 +118,9 @@ def parse_bailii_html(html_content: str) -> Dict[str, Any]:
         if not text:
             continue
 
-        # Check if paragraph has number [N]
-        para_match = re.match(r"^\[(\d+)\]\s+(.*)", text, re.DOTALL)
+        # Check if paragraph has number [N]; most unnumbered paragraphs
+        # are rejected by the first character without entering the regex
+        para_match = BAILII_PARA_RE.match(text) if text[0] == "[" else None
         if para_match:
             para_num = para_match.group(1)
             para_text = para_match.group(2).strip()
@@ -102,47 +141,23 @@ def parse_bailii_html(html_content: str) -> Dict[str, Any]:
     # Fallback for older cases without [N] numbering:
     # Extract substantial paragraphs from full text
     if not paragraphs:
-        # Skip navigation/header content - look for judgment content
-        lines = full_text.split("\n")
-
-        # Find start of actual judgment (after case details)
+        # Skip navigation/header content - start at the first line that
+        # looks like judgment content (one scan instead of a per-line loop)
         start_idx = 0
-        for i, line in enumerate(lines):
-            # Look for common judgment start indicators
-            if any(marker in line.lower() for marker in ['judgment', 'lord ', 'the court', 'opinion']):
-                start_idx = i
-                break
-
-        # Group lines into paragraphs (blank lines separate paragraphs)
-        current_para = []
-        para_num = 1
-
-        for line in lines[start_idx:]:
-            if not line.strip():
-                # End of paragraph
-                if current_para:
-                    para_text = " ".join(current_para).strip()
-                    # Only include substantial paragraphs (likely judgment content)
-                    if len(para_text) > 100:
-                        paragraphs.append({
-                            "para_num": str(para_num),
-                            "text": para_text,
-                            "speaker": None
-                        })
-                        para_num += 1
-                    current_para = []
-            else:
-                current_para.append(line.strip())
-
-        # Don't forget last paragraph
-        if current_para:
-            para_text = " ".join(current_para).strip()
-            if len(para_text) > 100:
-                paragraphs.append({
-                    "para_num": str(para_num),
-                    "text": para_text,
-                    "speaker": None
-                })
+        start_match = JUDGMENT_START_RE.search(full_text)
+        if start_match:
+            start_idx = full_text.rfind("\n", 0, start_match.start()) + 1
+
+        # full_text has no blank lines left after cleanup, so the judgment
+        # body forms a single paragraph
+        para_text = full_text[start_idx:].replace("\n", " ").strip()
+        # Only include substantial paragraphs (likely judgment content)
+        if len(para_text) > 100:
+            paragraphs.append({
+                "para_num": "1",
+                "text": para_text,
+                "speaker": None
+            })
 
     return {
         "title": title,
@@ -170,14 +185,9 @@ def extract_text_recursive(element: ET.Element) -> str:
     Returns:
         Concatenated text content
     """
-    text_parts = []
-    if element.text:
-        text_parts.append(element.text.strip())
-    for child in element:
-        text_parts.append(extract_text_recursive(child))
-        if child.tail:
-            text_parts.append(child.tail.strip())
-    return " ".join(filter(None, text_parts))
+    # itertext() walks the subtree in document order (text, children, tails)
+    # without recursing through Python frames
+    return " ".join(filter(None, (fragment.strip() for fragment in element.itertext())))
 
 
 def parse_fcl_xml(xml_content: str) -> Dict[str, Any]:
@@ -269,7 +279,7 @@ def parse_fcl_xml(xml_content: str) -> Dict[str, Any]:
                 # eId is usually like "para_1" or "paragraph_12"
                 para_num = None
                 if para_id:
-                    num_match = re.search(r'(\d+)', para_id)
+                    num_match = PARA_ID_NUMBER_RE.search(para_id)
                     if num_match:
                         para_num = num_match.group(1)
                     else:
@@ -321,11 +331,10 @@ def detect_source_type(content: str, url: str, cache_path: Path) -> str:
     if cache_path.suffix == ".xml":
         return "fcl_xml"
 
-    # Check URL hostname
-    if "caselaw.nationalarchives.gov.uk" in url.lower():
-        return "fcl_xml"
-    elif "bailii.org" in url.lower():
-        return "bailii"
+    # Check URL hostname (one case-insensitive scan instead of lowercasing per check)
+    host_match = SOURCE_HOST_RE.search(url)
+    if host_match:
+        return host_match.lastgroup
 
     # Check content (first 500 chars)
     content_sample = content[:500].strip()
@@ -342,6 +351,72 @@ def detect_source_type(content: str, url: str, cache_path: Path) -> str:
     return "bailii"
 
 
+def parse_content(content: str, source_type: str) -> Dict[str, Any]:
+    """
+    Parse document content with the parser for its source type.
+
+    Results are memoized on a SHA256 digest of the content, and every call
+    gets its own deep copy, so callers may modify the result freely.
+
+    Args:
+        content: Document content
+        source_type: "fcl_xml", "bailii", or anything else for plain text
+
+    Returns:
+        Parsed authority data (without url/parsed_at)
+    """
+    key = (hashlib.sha256(content.encode("utf-8")).digest(), source_type)
+    parsed = _PARSE_CACHE.get(key)
+    if parsed is None:
+        parsed = _parse_content_uncached(content, source_type)
+        _PARSE_CACHE.set(key, parsed)
+    return copy.deepcopy(parsed)
+
+
+def _parse_content_uncached(content: str, source_type: str) -> Dict[str, Any]:
+    """Dispatch content to the parser for its source type."""
+    if source_type == "fcl_xml":
+        return parse_fcl_xml(content)
+    if source_type == "bailii":
+        return parse_bailii_html(content)
+
+    # Fallback: basic text extraction - only the text nodes are needed, so
+    # read them straight from the lxml tree rather than building a soup
+    if lxml_html is not None:
+        try:
+            root = lxml_html.document_fromstring(
+                content.encode("utf-8"), parser=lxml_html.HTMLParser(encoding="utf-8")
+            )
+            full_text = "\n".join(
+                node
+                for node in TEXT_NODES(root)
+                if node.is_tail or node.getparent().tag not in SKIP_TEXT_TAGS
+            )
+        except lxml_etree.ParserError:
+            # Empty or whitespace-only document
+            full_text = ""
+    elif BeautifulSoup:
+        soup = BeautifulSoup(content, "lxml")
+        full_text = soup.get_text(separator="\n")
+    else:
+        full_text = content
+
+    return {
+        "title": "Unknown",
+        "case_name": None,
+        "neutral_citation": None,
+        "court": None,
+        "date": None,
+        "paragraphs": [],
+        "full_text": full_text,
+        "metadata": {
+            "parser_version": "0.2.0",
+            "parse_method": "fallback_text",
+            "warnings": ["Used fallback parser - limited structure extracted"],
+        },
+    }
+
+
 def parse_authority_document(
     job_id: str, cache_path: Path, url: str, source_type: Optional[str] = None
 ) -> Dict[str, Any]:
@@ -361,15 +436,24 @@ def parse_authority_document(
         FileNotFoundError: If cache file doesn't exist
         Exception: If parsing fails
     """
-    if not cache_path.exists():
-        raise FileNotFoundError(f"Cache file not found: {cache_path}")
+    # Read the file once; the latin-1 fallback decodes the same bytes
+    # instead of reading the file a second time
+    try:
+        raw = cache_path.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Cache file not found: {cache_path}") from None
 
-    # Read content with encoding fallback
     try:
-        content = safe_read_text(cache_path, encoding="utf-8")
+        content = raw.decode("utf-8")
     except UnicodeDecodeError:
         # Fallback to latin-1 which can handle any byte sequence
-        content = safe_read_text(cache_path, encoding="latin-1")
+        content = raw.decode("latin-1")
+    # Release the bytes before parsing so both copies are never held at once
+    del raw
+
+    # Match text-mode reads, which translate \r\n and \r to \n
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
 
     # Auto-detect source type if not provided
     if source_type is None:
@@ -377,32 +461,7 @@ def parse_authority_document(
         print(f"[OK] Detected source type: {source_type}")
 
     # Parse based on source type
-    if source_type == "fcl_xml":
-        parsed_data = parse_fcl_xml(content)
-    elif source_type == "bailii":
-        parsed_data = parse_bailii_html(content)
-    else:
-        # Fallback: basic text extraction
-        if BeautifulSoup:
-            soup = BeautifulSoup(content, "lxml")
-            full_text = soup.get_text(separator="\n")
-        else:
-            full_text = content
-
-        parsed_data = {
-            "title": "Unknown",
-            "case_name": None,
-            "neutral_citation": None,
-            "court": None,
-            "date": None,
-            "paragraphs": [],
-            "full_text": full_text,
-            "metadata": {
-                "parser_version": "0.2.0",
-                "parse_method": "fallback_text",
-                "warnings": ["Used fallback parser - limited structure extracted"],
-            },
-        }
+    parsed_data = parse_content(content, source_type)
 
     # Add URL and timestamp
     parsed_data["url"] = url
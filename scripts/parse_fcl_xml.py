@@ -37,14 +37,9 @@ def extract_text_recursive(element: ET.Element) -> str:
     Returns:
         Concatenated text content
     """
-    text_parts = []
-    if element.text:
-        text_parts.append(element.text.strip())
-    for child in element:
-        text_parts.append(extract_text_recursive(child))
-        if child.tail:
-            text_parts.append(child.tail.strip())
-    return " ".join(filter(None, text_parts))
+    # itertext() walks the subtree in document order (text, children, tails)
+    # without recursing through Python frames
+    return " ".join(filter(None, (fragment.strip() for fragment in element.itertext())))
 
 
 def parse_fcl_xml(xml_content: str, source_url: Optional[str] = None) -> Dict[str, Any]:
@@ -21,13 +21,23 @@ import logging
 from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
+from urllib.parse import urlencode
+import xml.etree.ElementTree as ET
 
 try:
     import requests
 except ImportError:
     requests = None
 
+try:
+    from bs4 import BeautifulSoup, SoupStrainer
+except ImportError:
+    BeautifulSoup = None
+    SoupStrainer = None
+
+from utils.cache_helpers import TTLCache
 from utils.file_helpers import safe_write_json
+from utils.http_helpers import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -230,6 +240,91 @@ CASE_NAME_PATTERNS = [
 ]
 
 
+# ===== COMPILED PATTERNS =====
+# Compiled once at import so hot paths skip re's internal cache lookup
+
+_BAILII_NEUTRAL_RES = [
+    (pattern_name, re.compile(config["pattern"], re.IGNORECASE), config["url_template"])
+    for pattern_name, config in BAILII_NEUTRAL_PATTERNS.items()
+]
+_FCL_NEUTRAL_RES = [
+    (pattern_name, re.compile(config["pattern"], re.IGNORECASE), config["url_template"])
+    for pattern_name, config in FCL_NEUTRAL_PATTERNS.items()
+]
+_TRADITIONAL_REPORT_RES = [re.compile(p, re.IGNORECASE) for p in TRADITIONAL_REPORT_PATTERNS]
+_CASE_NAME_RES = [re.compile(p, re.IGNORECASE) for p in CASE_NAME_PATTERNS]
+_CITATION_YEAR_RE = re.compile(r'\[(\d{4})\]')
+_SEARCH_TERM_WORD_RE = re.compile(r"[A-Za-z][A-Za-z']+")
+_FINDER_CITATION_RE = re.compile(r'\[\d{4}\]\s*\d*\s*[A-Za-z][A-Za-z\s]*\d+')
+_PAGE_NOT_FOUND_RE = re.compile(r'page not found', re.IGNORECASE)
+_V_PARTIES_RE = re.compile(r'([A-Za-z][A-Za-z\']+)(?:\s+\w+)*\s+v\.?\s+([A-Za-z][A-Za-z\']+)')
+
+# Phrases that mark a BAILII error or "not found" page (matched on lowercased text)
+BAILII_ERROR_INDICATORS = (
+    'not found',
+    'error 404',
+    'page not found',
+    'no case found',
+    'citation not found',
+    'this page does not exist',
+    'sorry, we could not find',
+)
+_BAILII_ERROR_RE = re.compile("|".join(re.escape(ind) for ind in BAILII_ERROR_INDICATORS))
+
+# Phrases on a citation-finder result page saying the citation itself was not found
+CITATION_FINDER_NOT_FOUND_PHRASES = (
+    'citation not found',
+    'case not found',
+    'no case found',
+    'no results found',
+    'could not be found',
+    'unable to find',
+    'was not found',
+)
+_CITATION_FINDER_NOT_FOUND_RE = re.compile(
+    "|".join(re.escape(phrase) for phrase in CITATION_FINDER_NOT_FOUND_PHRASES)
+)
+
+# Legal terms typically found on a real BAILII case page
+BAILII_CASE_INDICATORS = (
+    'judgment',
+    'court',
+    'lord',
+    'justice',
+    'appeal',
+    'claimant',
+    'defendant',
+    'respondent',
+    'appellant',
+    'lordship',
+    'held',
+    'ordered',
+)
+
+# How long a URL existence check is trusted before the page is fetched again
+URL_EXISTS_TTL_SEC = 3600
+
+# (source, url) -> bool; only definitive answers are stored, never transient failures
+_URL_EXISTS_CACHE = TTLCache(maxsize=4096, ttl_sec=URL_EXISTS_TTL_SEC)
+
+# Common words excluded from case-name search terms
+CASE_NAME_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'of', 'in', 'on', 'at', 'to', 'for',
+    'v', 'vs', 're', 'ex', 'parte',
+    'plc', 'ltd', 'limited', 'inc', 'incorporated', 'co', 'corp', 'corporation',
+    'council', 'authority', 'board', 'committee', 'commission', 'commissioners',
+    'hospital', 'trust', 'nhs', 'ha', 'health',
+    'ministry', 'secretary', 'state', 'government',
+    'no', 'number',
+})
+
+# Common case-name words too generic to confirm a BAILII direct-URL match
+DIRECT_URL_IGNORED_WORDS = frozenset({
+    'the', 'and', 'plc', 'ltd', 'limited', 'committee', 'hospital', 'management',
+})
+_CAPITALIZED_WORD_RE = re.compile(r'\b([A-Z][a-z]+)\b')
+
+
 def extract_case_name(text: str) -> Optional[str]:
     """
     Extract case name from text containing a citation.
@@ -240,19 +335,17 @@ def extract_case_name(text: str) -> Optional[str]:
     Returns:
         Case name if found, None otherwise
     """
-    for pattern in CASE_NAME_PATTERNS:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _CASE_NAME_RES:
+        match = pattern.search(text)
         if match:
-            case_name = match.group(0).strip()
-            # Clean up
-            case_name = re.sub(r'\s+', ' ', case_name)
-            return case_name
+            # Clean up - collapse whitespace runs without a regex pass
+            return " ".join(match.group(0).split())
     return None
 
 
 def extract_citation_year(citation_text: str) -> Optional[str]:
     """Extract year from any citation format."""
-    match = re.search(r'\[(\d{4})\]', citation_text)
+    match = _CITATION_YEAR_RE.search(citation_text)
     if match:
         return match.group(1)
     return None
@@ -269,17 +362,17 @@ def try_bailii_neutral_citation_patterns(citation_text: str, verify_url: bool =
         citation_text: The citation to resolve
         verify_url: If True, verify the constructed URL actually returns a valid case page
     """
-    for pattern_name, config in BAILII_NEUTRAL_PATTERNS.items():
-        match = re.search(config["pattern"], citation_text, re.IGNORECASE)
+    for pattern_name, pattern, url_template in _BAILII_NEUTRAL_RES:
+        match = pattern.search(citation_text)
         if match:
             year = match.group(1)
             num = match.group(2)
-            url = config["url_template"].format(year=year, num=num)
+            url = url_template.format(year=year, num=num)
 
             # Verify the URL actually returns a valid case page
             if verify_url and requests is not None:
                 if not verify_bailii_url_exists(url):
-                    logger.debug(f"BAILII neutral citation URL does not exist: {url}")
+                    logger.debug("BAILII neutral citation URL does not exist: %s", url)
                     continue  # Try next pattern if this URL doesn't work
 
             return {
@@ -300,12 +393,24 @@ def verify_bailii_url_exists(url: str, timeout: int = 10) -> bool:
 
     Returns True if the URL exists and contains case content.
     Returns False if it's a 404, error page, or empty page.
+    Definitive answers are reused for URL_EXISTS_TTL_SEC.
     """
     if requests is None:
         return True  # Can't verify, assume it exists
 
+    cache_key = ("bailii", url)
+    exists = _URL_EXISTS_CACHE.get(cache_key)
+    if exists is None:
+        exists = _check_bailii_url(url, timeout)
+        if exists is not None:
+            _URL_EXISTS_CACHE.set(cache_key, exists)
+    return bool(exists)
+
+
+def _check_bailii_url(url: str, timeout: int) -> Optional[bool]:
+    """Fetch and validate a BAILII case page; None if the check failed transiently."""
     try:
-        response = requests.get(
+        response = get_session().get(
             url,
             timeout=timeout,
             headers={
@@ -314,6 +419,10 @@ def verify_bailii_url_exists(url: str, timeout: int = 10) -> bool:
             allow_redirects=True
         )
 
+        # Rate limiting or server trouble says nothing about the page
+        if response.status_code == 429 or response.status_code >= 500:
+            return None
+
         if response.status_code != 200:
             return False
 
@@ -322,20 +431,20 @@ def verify_bailii_url_exists(url: str, timeout: int = 10) -> bool:
             return False
 
         # Parse and validate content
-        try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.text, 'lxml')
+        if BeautifulSoup is not None:
+            soup = BeautifulSoup(response.content, 'lxml', from_encoding=response.encoding)
             return validate_bailii_page_has_content(soup)
-        except ImportError:
+        else:
             # Can't validate content without BeautifulSoup, check basic indicators
-            text_lower = response.text.lower()
-            if 'not found' in text_lower[:500] or 'error' in text_lower[:500]:
+            # Only the start of the page matters - lowercase just that
+            head_lower = response.text[:500].lower()
+            if 'not found' in head_lower or 'error' in head_lower:
                 return False
             return len(response.text) > 1000
 
     except Exception as e:
-        logger.debug(f"Error verifying BAILII URL {url}: {e}")
-        return False
+        logger.debug("Error verifying BAILII URL %s: %s", url, e)
+        return None
 
 
 def try_fcl_neutral_citation_patterns(citation_text: str, verify_url: bool = True) -> Optional[Dict[str, Any]]:
@@ -349,17 +458,17 @@ def try_fcl_neutral_citation_patterns(citation_text: str, verify_url: bool = Tru
         citation_text: The citation to resolve
         verify_url: If True, verify the constructed URL actually returns a valid case page
     """
-    for pattern_name, config in FCL_NEUTRAL_PATTERNS.items():
-        match = re.search(config["pattern"], citation_text, re.IGNORECASE)
+    for pattern_name, pattern, url_template in _FCL_NEUTRAL_RES:
+        match = pattern.search(citation_text)
         if match:
             year = match.group(1)
             num = match.group(2)
-            url = config["url_template"].format(year=year, num=num)
+            url = url_template.format(year=year, num=num)
 
             # Verify the URL actually returns a valid case page
             if verify_url and requests is not None:
                 if not verify_fcl_url_exists(url):
-                    logger.debug(f"FCL neutral citation URL does not exist: {url}")
+                    logger.debug("FCL neutral citation URL does not exist: %s", url)
                     continue  # Try next pattern if this URL doesn't work
 
             return {
@@ -380,12 +489,24 @@ def verify_fcl_url_exists(url: str, timeout: int = 10) -> bool:
 
     Returns True if the URL exists and contains case content.
     Returns False if it's a 404, error page, or empty page.
+    Definitive answers are reused for URL_EXISTS_TTL_SEC.
     """
     if requests is None:
         return True  # Can't verify, assume it exists
 
+    cache_key = ("find_case_law", url)
+    exists = _URL_EXISTS_CACHE.get(cache_key)
+    if exists is None:
+        exists = _check_fcl_url(url, timeout)
+        if exists is not None:
+            _URL_EXISTS_CACHE.set(cache_key, exists)
+    return bool(exists)
+
+
+def _check_fcl_url(url: str, timeout: int) -> Optional[bool]:
+    """Fetch and validate an FCL case page; None if the check failed transiently."""
     try:
-        response = requests.get(
+        response = get_session().get(
             url,
             timeout=timeout,
             headers={
@@ -398,32 +519,38 @@ def verify_fcl_url_exists(url: str, timeout: int = 10) -> bool:
         if response.status_code == 404:
             return False
 
+        # Rate limiting or server trouble says nothing about the page
+        if response.status_code == 429 or response.status_code >= 500:
+            return None
+
         if response.status_code != 200:
             return False
 
+        # response.text re-decodes the body on every access, so decode once
+        text = response.text
+
         # Check for "Page not found" in response (FCL shows this for invalid URLs)
-        text_lower = response.text.lower()
-        if 'page not found' in text_lower[:1000]:
+        if _PAGE_NOT_FOUND_RE.search(text, 0, 1000):
             return False
 
         # For XML responses, check if it contains actual case data
         if url.endswith('.xml') or 'xml' in response.headers.get('content-type', ''):
             # Valid FCL XML should contain case elements
-            if '<FRBRWork' not in response.text and '<akomaNtoso' not in response.text:
+            if '<FRBRWork' not in text and '<akomaNtoso' not in text:
                 # Not a valid AkomaNtoso XML document
                 return False
 
         # For HTML responses, check for case content
         else:
             # Should have substantial content
-            if len(response.text) < 1000:
+            if len(text) < 1000:
                 return False
 
         return True
 
     except Exception as e:
-        logger.debug(f"Error verifying FCL URL {url}: {e}")
-        return False
+        logger.debug("Error verifying FCL URL %s: %s", url, e)
+        return None
 
 
 def try_neutral_citation_patterns(citation_text: str) -> Optional[Dict[str, Any]]:
@@ -448,8 +575,8 @@ def try_neutral_citation_patterns(citation_text: str) -> Optional[Dict[str, Any]
 
 def is_traditional_citation(citation_text: str) -> bool:
     """Check if this is a traditional law report citation."""
-    for pattern in TRADITIONAL_REPORT_PATTERNS:
-        if re.search(pattern, citation_text, re.IGNORECASE):
+    for pattern in _TRADITIONAL_REPORT_RES:
+        if pattern.search(citation_text):
             return True
     return False
 
@@ -480,29 +607,28 @@ def search_fcl_by_query(query: str, timeout: int = 30) -> List[Dict[str, Any]]:
             "order": "-date",
         }
         
-        logger.debug(f"FCL Atom request: {url} params={params}")
+        logger.debug("FCL Atom request: %s params=%s", url, params)
         
-        response = requests.get(
+        response = get_session().get(
             url,
             params=params,
             timeout=timeout,
             headers={"User-Agent": "HallucinationAuditor/0.3.0"}
         )
         
-        logger.debug(f"FCL response status: {response.status_code}")
+        logger.debug("FCL response status: %s", response.status_code)
         
         if response.status_code != 200:
             logger.warning(f"FCL search returned {response.status_code}")
             # Try alternative search with query param
             params = {"query": query, "per_page": 10}
-            response = requests.get(url, params=params, timeout=timeout,
-                                   headers={"User-Agent": "HallucinationAuditor/0.3.0"})
+            response = get_session().get(url, params=params, timeout=timeout,
+                                         headers={"User-Agent": "HallucinationAuditor/0.3.0"})
             if response.status_code != 200:
                 logger.warning(f"FCL fallback search also returned {response.status_code}")
                 return []
         
         # Parse Atom XML
-        import xml.etree.ElementTree as ET
         root = ET.fromstring(response.content)
         
         ns = {
@@ -609,10 +735,11 @@ def try_bailii_direct_url(case_name: str, year: str, timeout: int = 10, citation
     search_terms = []
     if case_name:
         # Get significant words
-        words = re.findall(r'\b([A-Z][a-z]+)\b', case_name)
-        search_terms = [w.lower() for w in words if w.lower() not in ['the', 'and', 'plc', 'ltd', 'limited', 'committee', 'hospital', 'management']]
+        words = (w.lower() for w in _CAPITALIZED_WORD_RE.findall(case_name))
+        search_terms = [w for w in words if w not in DIRECT_URL_IGNORED_WORDS]
+    required_matches = min(2, len(search_terms)) if len(search_terms) > 1 else 1
 
-    logger.debug(f"BAILII direct URL search: case_name={case_name}, year={year}, report={detected_report}, courts={courts_to_try[:3]}")
+    logger.debug("BAILII direct URL search: case_name=%s, year=%s, report=%s, courts=%s", case_name, year, detected_report, courts_to_try[:3])
 
     for court, jurisdiction in courts_to_try[:3]:  # Try up to 3 courts
         # Try case numbers for that year (expand range for better coverage)
@@ -620,7 +747,7 @@ def try_bailii_direct_url(case_name: str, year: str, timeout: int = 10, citation
             url = f"https://www.bailii.org/{jurisdiction}/cases/{court}/{year}/{case_num}.html"
 
             try:
-                response = requests.head(
+                response = get_session().head(
                     url,
                     timeout=3,
                     headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"},
@@ -629,7 +756,7 @@ def try_bailii_direct_url(case_name: str, year: str, timeout: int = 10, citation
 
                 if response.status_code == 200:
                     # Verify it's the right case by fetching and checking content
-                    full_response = requests.get(
+                    full_response = get_session().get(
                         url,
                         timeout=timeout,
                         headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
@@ -638,22 +765,31 @@ def try_bailii_direct_url(case_name: str, year: str, timeout: int = 10, citation
                     if full_response.status_code == 200:
                         content_lower = full_response.text.lower()
 
-                        # Check if search terms appear in the content
-                        matches = sum(1 for term in search_terms if term in content_lower)
-                        required_matches = min(2, len(search_terms)) if len(search_terms) > 1 else 1
+                        # Check if search terms appear in the content, stopping
+                        # as soon as enough have been seen
+                        matches = 0
+                        for term in search_terms:
+                            if term in content_lower:
+                                matches += 1
+                                if matches >= required_matches:
+                                    break
                         if matches >= required_matches:
                             # Found it!
                             # Try to extract title
                             title = case_name or f"BAILII {court} {year}/{case_num}"
 
-                            try:
-                                from bs4 import BeautifulSoup
-                                soup = BeautifulSoup(full_response.text, 'lxml')
-                                title_tag = soup.find('title')
-                                if title_tag:
-                                    title = title_tag.get_text().strip()
-                            except:
-                                pass
+                            if BeautifulSoup is not None:
+                                try:
+                                    # Only the <title> is needed from the judgment page
+                                    soup = BeautifulSoup(
+                                        full_response.content, 'lxml', from_encoding=full_response.encoding,
+                                        parse_only=SoupStrainer('title'),
+                                    )
+                                    title_tag = soup.find('title')
+                                    if title_tag:
+                                        title = title_tag.get_text().strip()
+                                except:
+                                    pass
 
                             logger.info(f"Found case on BAILII: {url}")
                             return {
@@ -683,29 +819,15 @@ def normalize_case_name_for_search(case_name: str) -> List[str]:
     if not case_name:
         return []
 
-    # Common words to exclude
-    stop_words = {
-        'the', 'a', 'an', 'and', 'or', 'of', 'in', 'on', 'at', 'to', 'for',
-        'v', 'vs', 're', 'ex', 'parte',
-        'plc', 'ltd', 'limited', 'inc', 'incorporated', 'co', 'corp', 'corporation',
-        'council', 'authority', 'board', 'committee', 'commission', 'commissioners',
-        'hospital', 'trust', 'nhs', 'ha', 'health',
-        'ministry', 'secretary', 'state', 'government',
-        'no', 'number'
-    }
-
     # Extract all words (including those with apostrophes like O'Brien)
-    words = re.findall(r"[A-Za-z][A-Za-z']+", case_name)
-
-    # Filter to significant words
-    terms = []
-    for word in words:
-        word_lower = word.lower()
-        # Keep if not a stop word and has at least 3 chars
-        if word_lower not in stop_words and len(word) >= 3:
-            terms.append(word_lower)
+    words = _SEARCH_TERM_WORD_RE.findall(case_name)
 
-    return terms
+    # Keep words of at least 3 chars that are not stop words
+    return [
+        word_lower
+        for word_lower in (word.lower() for word in words if len(word) >= 3)
+        if word_lower not in CASE_NAME_STOP_WORDS
+    ]
 
 
 def try_bailii_citation_finder(citation_text: str, timeout: int = 30) -> Optional[Dict[str, Any]]:
@@ -722,20 +844,19 @@ def try_bailii_citation_finder(citation_text: str, timeout: int = 30) -> Optiona
 
         # Extract just the citation portion (e.g., "[1990] 2 AC 605")
         # More flexible pattern to catch various formats
-        citation_match = re.search(r'\[\d{4}\]\s*\d*\s*[A-Za-z][A-Za-z\s]*\d+', citation_text)
+        citation_match = _FINDER_CITATION_RE.search(citation_text)
         if citation_match:
             clean_citation = citation_match.group(0)
         else:
             clean_citation = citation_text
 
-        logger.debug(f"BAILII citation finder: {clean_citation}")
+        logger.debug("BAILII citation finder: %s", clean_citation)
 
         # Use form-urlencoded data with explicit Content-Type header
         # This ensures Content-Length is properly calculated
-        from urllib.parse import urlencode
         form_data = urlencode({"citation": clean_citation})
 
-        response = requests.post(
+        response = get_session().post(
             url,
             data=form_data,
             timeout=timeout,
@@ -751,19 +872,18 @@ def try_bailii_citation_finder(citation_text: str, timeout: int = 30) -> Optiona
 
         # Check if we got redirected to the error page
         if 'error.bailii.org' in response.url:
-            logger.debug(f"BAILII citation finder: redirected to error page for {clean_citation}")
+            logger.debug("BAILII citation finder: redirected to error page for %s", clean_citation)
             return None
 
         # Check if we got a case page (redirect) or the search page (not found)
-        try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.text, 'lxml')
+        if BeautifulSoup is not None:
+            soup = BeautifulSoup(response.content, 'lxml', from_encoding=response.encoding)
             title_elem = soup.find('title')
             if title_elem:
                 title = title_elem.get_text().strip()
                 # If we're still on the search page or error page, the case wasn't found
                 if 'Find by citation' in title or 'error' in title.lower():
-                    logger.debug(f"BAILII citation finder: not found for {clean_citation}")
+                    logger.debug("BAILII citation finder: not found for %s", clean_citation)
                     return None
 
                 # Check for "Not found" in page content - BAILII sometimes returns 200 but shows error
@@ -771,16 +891,9 @@ def try_bailii_citation_finder(citation_text: str, timeout: int = 30) -> Optiona
                 if 'not found' in page_text and ('citation' in page_text or 'case' in page_text):
                     # Check if the "not found" is referring to the case itself
                     # Look for patterns like "citation not found", "case not found", "no results"
-                    if any(phrase in page_text for phrase in [
-                        'citation not found',
-                        'case not found',
-                        'no case found',
-                        'no results found',
-                        'could not be found',
-                        'unable to find',
-                        'was not found'
-                    ]):
-                        logger.debug(f"BAILII citation finder: 'not found' message detected for {clean_citation}")
+                    # One scan of the page for every phrase
+                    if _CITATION_FINDER_NOT_FOUND_RE.search(page_text):
+                        logger.debug("BAILII citation finder: 'not found' message detected for %s", clean_citation)
                         return None
 
                 # We found the case! Extract URL from the final redirect
@@ -789,13 +902,13 @@ def try_bailii_citation_finder(citation_text: str, timeout: int = 30) -> Optiona
 
                 # Double-check the URL is valid (not an error page or cgi script)
                 if 'error' in case_url.lower() or '/cgi-bin/' in case_url:
-                    logger.debug(f"BAILII citation finder: invalid URL {case_url}")
+                    logger.debug("BAILII citation finder: invalid URL %s", case_url)
                     return None
 
                 # Validate that the page actually contains case content
                 # A real case page should have judgment text
                 if not validate_bailii_page_has_content(soup):
-                    logger.debug(f"BAILII citation finder: page has no case content for {clean_citation}")
+                    logger.debug("BAILII citation finder: page has no case content for %s", clean_citation)
                     return None
 
                 logger.info(f"BAILII citation finder: found {title[:60]} at {case_url}")
@@ -806,8 +919,6 @@ def try_bailii_citation_finder(citation_text: str, timeout: int = 30) -> Optiona
                     "confidence": 0.95,
                     "resolution_method": "bailii_citation_finder",
                 }
-        except ImportError:
-            pass
 
         return None
 
@@ -828,30 +939,18 @@ def validate_bailii_page_has_content(soup) -> bool:
         text = soup.get_text()
         text_lower = text.lower()
 
-        # Check for error indicators
-        error_indicators = [
-            'not found',
-            'error 404',
-            'page not found',
-            'no case found',
-            'citation not found',
-            'this page does not exist',
-            'sorry, we could not find',
-        ]
-
-        for indicator in error_indicators:
-            if indicator in text_lower:
-                # Make sure it's a prominent error, not just mentioned in passing
-                # Check if the error phrase appears in a heading or at the start
-                h1_tags = soup.find_all(['h1', 'h2', 'h3'])
-                for h in h1_tags:
-                    if indicator in h.get_text().lower():
-                        return False
-
-                # Check if "not found" is in the first 500 chars (likely an error message)
-                if indicator in text_lower[:500]:
+        # One scan for every error indicator; only look closer if one occurs
+        if _BAILII_ERROR_RE.search(text_lower):
+            # Make sure it's a prominent error, not just mentioned in passing
+            # Check if the error phrase appears in a heading or at the start
+            for h in soup.find_all(['h1', 'h2', 'h3']):
+                if _BAILII_ERROR_RE.search(h.get_text().lower()):
                     return False
 
+            # Check if "not found" is in the first 500 chars (likely an error message)
+            if _BAILII_ERROR_RE.search(text_lower, 0, 500):
+                return False
+
         # Check for positive indicators that this is a real case
         # Real BAILII case pages typically have:
         # 1. A substantial amount of text (judgments are long)
@@ -862,32 +961,26 @@ def validate_bailii_page_has_content(soup) -> bool:
         if len(text) < 1000:
             return False
 
-        # Look for typical case page elements
-        positive_indicators = [
-            'judgment',
-            'court',
-            'lord',
-            'justice',
-            'appeal',
-            'claimant',
-            'defendant',
-            'respondent',
-            'appellant',
-            'lordship',
-            'held',
-            'ordered',
-        ]
-
-        matches = sum(1 for ind in positive_indicators if ind in text_lower)
-
         # Should have at least 3 legal terms to be a real case
-        return matches >= 3
+        matches = 0
+        for ind in BAILII_CASE_INDICATORS:
+            if ind in text_lower:
+                matches += 1
+                if matches >= 3:
+                    return True
+        return False
 
     except Exception as e:
-        logger.debug(f"Error validating BAILII page: {e}")
+        logger.debug("Error validating BAILII page: %s", e)
         return False
 
 
+def _is_bailii_case_href(href: Optional[str]) -> bool:
+    """Check whether a link target looks like a BAILII case page."""
+    # BAILII case URLs follow pattern: /uk/cases/COURT/YEAR/NUMBER.html
+    return bool(href) and '/cases/' in href and href.endswith('.html')
+
+
 def search_bailii(query: str, year: Optional[str] = None, case_name: Optional[str] = None, timeout: int = 30, citation_text: str = None) -> List[Dict[str, Any]]:
     """
     Search BAILII for cases using multiple strategies.
@@ -940,13 +1033,12 @@ def search_bailii(query: str, year: Optional[str] = None, case_name: Optional[st
             "highlight": "1",
         }
 
-        logger.debug(f"BAILII search: {search_url} titleall={query}")
+        logger.debug("BAILII search: %s titleall=%s", search_url, query)
 
         # Use form-urlencoded with explicit Content-Type to avoid HTTP 411 errors
-        from urllib.parse import urlencode
         form_data = urlencode(search_data)
 
-        response = requests.post(
+        response = get_session().post(
             search_url,
             data=form_data,
             timeout=timeout,
@@ -960,44 +1052,47 @@ def search_bailii(query: str, year: Optional[str] = None, case_name: Optional[st
             logger.warning(f"BAILII search returned {response.status_code}")
         else:
             # Parse results from HTML
-            try:
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(response.text, 'lxml')
+            if BeautifulSoup is not None:
+                # Only case links are used, so filter anchors on their href while
+                # parsing instead of building (and text-extracting) every link
+                soup = BeautifulSoup(
+                    response.content, 'lxml', from_encoding=response.encoding,
+                    parse_only=SoupStrainer('a', href=_is_bailii_case_href),
+                )
                 
                 # Look for links to case pages
-                for link in soup.find_all('a', href=True):
-                    href = link.get('href', '')
+                for link in soup.find_all('a'):
+                    href = link['href']
+
+                    # Make URL absolute
+                    if href.startswith('/'):
+                        full_url = f"https://www.bailii.org{href}"
+                    elif href.startswith('http'):
+                        full_url = href
+                    else:
+                        continue
+
                     text = link.get_text().strip()
                     
-                    # BAILII case URLs follow pattern: /uk/cases/COURT/YEAR/NUMBER.html
-                    if '/cases/' in href and href.endswith('.html'):
-                        # Make URL absolute
-                        if href.startswith('/'):
-                            full_url = f"https://www.bailii.org{href}"
-                        elif href.startswith('http'):
-                            full_url = href
-                        else:
-                            continue
-                        
-                        # Check if year matches (if provided)
-                        if year and year not in href and year not in text:
-                            continue
-                        
-                        # Skip navigation links
-                        if len(text) < 5 or text.lower() in ['next', 'previous', 'back', 'home']:
-                            continue
-                        
-                        results.append({
-                            "title": text,
-                            "url": full_url,
-                            "source": "bailii",
-                            "confidence": 0.75,
-                        })
-                        
-                        if len(results) >= 5:
-                            break
+                    # Check if year matches (if provided)
+                    if year and year not in href and year not in text:
+                        continue
+                    
+                    # Skip navigation links
+                    if len(text) < 5 or text.lower() in ('next', 'previous', 'back', 'home'):
+                        continue
+                    
+                    results.append({
+                        "title": text,
+                        "url": full_url,
+                        "source": "bailii",
+                        "confidence": 0.75,
+                    })
+                    
+                    if len(results) >= 5:
+                        break
                             
-            except ImportError:
+            else:
                 logger.warning("BeautifulSoup not installed, BAILII HTML parsing disabled")
         
         logger.info(f"BAILII search found {len(results)} results")
@@ -1029,7 +1124,7 @@ def resolve_traditional_citation(citation_text: str, case_name: Optional[str] =
     # If we still don't have search terms, try to extract from citation itself
     if not search_terms:
         # Look for case name pattern in citation_text
-        v_match = re.search(r'([A-Za-z][A-Za-z\']+)(?:\s+\w+)*\s+v\.?\s+([A-Za-z][A-Za-z\']+)', citation_text)
+        v_match = _V_PARTIES_RE.search(citation_text)
         if v_match:
             search_terms = [v_match.group(1).lower(), v_match.group(2).lower()]
 
@@ -1066,8 +1161,9 @@ def resolve_traditional_citation(citation_text: str, case_name: Optional[str] =
             # Check if the year matches (in title or URI)
             if year:
                 year_match = year in result_title or year in result_uri
-                # Also check if the search terms appear in the title
-                terms_match = all(term.lower() in result_title.lower() for term in search_terms)
+                # Also check if the search terms (already lowercase) appear in the title
+                title_lower = result_title.lower()
+                terms_match = all(term in title_lower for term in search_terms)
 
                 if year_match and terms_match:
                     # High confidence - year and terms match
@@ -1148,10 +1244,12 @@ def resolve_citation_to_urls(
     # Try BAILII citation finder + search + FCL search
     search_candidates = resolve_traditional_citation(citation_text, case_name)
     
+    # Avoid duplicates (set of URLs seen so far instead of a rescan per candidate)
+    seen_urls = {c.get("url") for c in candidate_urls}
     for candidate in search_candidates:
-        # Avoid duplicates
-        existing_urls = [c.get("url") for c in candidate_urls]
-        if candidate.get("url") not in existing_urls:
+        url = candidate.get("url")
+        if url not in seen_urls:
+            seen_urls.add(url)
             candidate_urls.append(candidate)
     
     if search_candidates:
@@ -5,5 +5,6 @@ Modules:
 - cache_helpers: Cache management functions
 - hash_helpers: Content hashing utilities
 - file_helpers: Safe file I/O operations
+- http_helpers: Shared HTTP session for outbound requests
 - validation: Input validation and schema checking
 """
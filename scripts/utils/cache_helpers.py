@@ -2,10 +2,19 @@
 Cache management for deterministic artifact storage.
 """
 
+import json
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Hashable, Optional
 
 from .file_helpers import safe_read_json, safe_write_json, ensure_dir
+from .hash_helpers import sha256_string
+
+
+# Cross-job store of resolved citations, keyed by a hash of the lookup
+CITATION_CACHE_DIR = Path("cache") / "_citation_cache"
 
 
 def get_cache_path(job_id: str, filename: str) -> Path:
@@ -135,3 +144,116 @@ def ensure_sources_dir(job_id: str) -> Path:
     sources_dir = Path("sources") / job_id
     ensure_dir(sources_dir)
     return sources_dir
+
+
+def get_citation_cache_path(key: str) -> Path:
+    """
+    Get path for a cached citation resolution.
+
+    Args:
+        key: Lookup key (citation text plus any disambiguating context)
+
+    Returns:
+        Path to cache file
+    """
+    return CITATION_CACHE_DIR / f"{sha256_string(key)}.json"
+
+
+def read_citation_cache(key: str, ttl_sec: float) -> Optional[Dict[str, Any]]:
+    """
+    Read a cached citation resolution if it is younger than ttl_sec.
+
+    Args:
+        key: Lookup key
+        ttl_sec: Maximum age in seconds
+
+    Returns:
+        Cached data, or None on a miss, an expired entry, or an unreadable file
+    """
+    cache_path = get_citation_cache_path(key)
+    try:
+        if time.time() - cache_path.stat().st_mtime > ttl_sec:
+            return None
+        return safe_read_json(cache_path)
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        return None
+
+
+def write_citation_cache(key: str, data: Dict[str, Any]) -> Path:
+    """
+    Write a citation resolution to the cross-job cache.
+
+    Args:
+        key: Lookup key
+        data: Data to write
+
+    Returns:
+        Path to written file
+    """
+    cache_path = get_citation_cache_path(key)
+    safe_write_json(cache_path, data)
+    return cache_path
+
+
+class TTLCache:
+    """
+    Thread-safe in-memory LRU cache whose entries expire after a fixed age.
+
+    For process-local memoization of network lookups that may be shared by
+    request threads; the disk citation cache above is the cross-process store.
+    """
+
+    def __init__(self, maxsize: int, ttl_sec: float):
+        """
+        Args:
+            maxsize: Maximum number of entries before the least recently used is evicted
+            ttl_sec: Seconds an entry stays valid after it is set
+        """
+        self.maxsize = maxsize
+        self.ttl_sec = ttl_sec
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the cached value for key, or default if missing or expired.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store value under key, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_sec, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -3,6 +3,7 @@ Safe file I/O with validation and atomic writes.
 """
 
 import json
+import tempfile
 from pathlib import Path
 from typing import Any, Dict
 
@@ -87,7 +88,8 @@ def safe_write_json(path: Path, data: Dict[str, Any], indent: int = 2) -> None:
     """
     Atomic write of JSON file.
 
-    Uses temp file + rename for atomicity.
+    Uses a uniquely named temp file + rename, so concurrent writers of the
+    same path never share a temp file; the last rename wins.
 
     Args:
         path: File path to write
@@ -97,10 +99,17 @@ def safe_write_json(path: Path, data: Dict[str, Any], indent: int = 2) -> None:
     # Ensure parent directory exists
     ensure_dir(path.parent)
 
-    # Write to temp file first
-    temp_path = path.with_suffix(path.suffix + ".tmp")
-    with open(temp_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=indent, ensure_ascii=False)
+    # Write to a temp file in the same directory first
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False
+    ) as f:
+        temp_path = Path(f.name)
+        try:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+        except BaseException:
+            f.close()
+            temp_path.unlink(missing_ok=True)
+            raise
 
     # Atomic rename
     temp_path.replace(path)
@@ -0,0 +1,71 @@
+"""
+Shared HTTP session for outbound requests to legal databases.
+"""
+
+from typing import Optional
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:
+    requests = None
+
+
+# Keep-alive connections held per host; sized for the API's worker threads
+POOL_MAXSIZE = 32
+
+# Transient gateway errors retried at the transport level (idempotent methods only).
+# 429 is left to callers so they can back off politely per source.
+RETRY_STATUSES = (502, 503, 504)
+
+
+# Process-wide session, created on first use and reused afterwards
+_session: Optional["requests.Session"] = None
+
+
+def get_session() -> "requests.Session":
+    """
+    Get the shared HTTP session, creating it on first use.
+
+    Reusing one session keeps connections to BAILII and Find Case Law
+    alive across calls instead of opening a new TCP/TLS connection for
+    every request.
+
+    Returns:
+        Shared requests.Session
+
+    Raises:
+        ImportError: If requests is not installed
+    """
+    global _session
+    if requests is None:
+        raise ImportError("requests library required: pip install requests")
+    if _session is None:
+        _session = _build_session()
+    return _session
+
+
+def _build_session() -> "requests.Session":
+    """
+    Build a session with a sized connection pool and transient-error retries.
+
+    Returns:
+        Configured requests.Session
+    """
+    retry = Retry(
+        total=2,
+        backoff_factor=0.5,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        raise_on_status=False,
+        # urllib3 would sleep for any Retry-After, however long, on a shared
+        # worker thread; callers that honour it apply their own cap
+        respect_retry_after_header=False,
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
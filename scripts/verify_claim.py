@@ -14,27 +14,15 @@ import sys
 import re
 from pathlib import Path
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Dict, Any, List, Set
 
 from utils.file_helpers import safe_read_json, safe_write_json
 
 
-def extract_keywords(text: str, min_length: int = 4) -> Set[str]:
-    """
-    Extract keywords from text for matching.
-
-    Args:
-        text: Text to extract keywords from
-        min_length: Minimum keyword length (default: 4)
-
-    Returns:
-        Set of lowercase keywords
-    """
-    # Remove punctuation and split
-    words = re.findall(r"\b[a-zA-Z]{" + str(min_length) + r",}\b", text.lower())
-
-    # Remove common stop words
-    stop_words = {
+# Common words ignored when extracting keywords (built once, not per call)
+STOP_WORDS = frozenset(
+    {
         "that",
         "this",
         "with",
@@ -52,8 +40,39 @@ def extract_keywords(text: str, min_length: int = 4) -> Set[str]:
         "which",
         "when",
     }
+)
+
+
+@lru_cache(maxsize=None)
+def _keyword_pattern(min_length: int) -> "re.Pattern[str]":
+    """
+    Compile the keyword regex for a minimum word length once.
+
+    Args:
+        min_length: Minimum keyword length
+
+    Returns:
+        Compiled pattern matching whole alphabetic words of at least min_length
+    """
+    return re.compile(r"\b[a-zA-Z]{" + str(min_length) + r",}\b")
 
-    return set(words) - stop_words
+
+def extract_keywords(text: str, min_length: int = 4) -> Set[str]:
+    """
+    Extract keywords from text for matching.
+
+    Args:
+        text: Text to extract keywords from
+        min_length: Minimum keyword length (default: 4)
+
+    Returns:
+        Set of lowercase keywords
+    """
+    # Remove punctuation and split
+    words = _keyword_pattern(min_length).findall(text.lower())
+
+    # Remove common stop words
+    return set(words) - STOP_WORDS
 
 
 def calculate_keyword_overlap(claim_text: str, authority_text: str) -> float:
@@ -67,13 +86,28 @@ def calculate_keyword_overlap(claim_text: str, authority_text: str) -> float:
     Returns:
         Overlap ratio (0.0 to 1.0)
     """
-    claim_keywords = extract_keywords(claim_text)
-    authority_keywords = extract_keywords(authority_text)
+    return _overlap_with_keywords(extract_keywords(claim_text), authority_text)
+
+
+def _overlap_with_keywords(claim_keywords: Set[str], authority_text: str) -> float:
+    """
+    Calculate overlap for claim keywords that have already been extracted.
+
+    Args:
+        claim_keywords: Keywords extracted from the claim
+        authority_text: Authority text
 
+    Returns:
+        Overlap ratio (0.0 to 1.0)
+    """
     if not claim_keywords:
         return 0.0
 
-    overlap = len(claim_keywords & authority_keywords)
+    # Claim keywords already exclude stop words, so intersecting with the raw
+    # word stream gives the same overlap without building the authority's
+    # keyword set or subtracting stop words from it
+    authority_words = _keyword_pattern(4).findall(authority_text.lower())
+    overlap = len(claim_keywords.intersection(authority_words))
     return overlap / len(claim_keywords)
 
 
@@ -93,9 +127,12 @@ def find_matching_paragraphs(
     """
     matches = []
 
+    # Extract claim keywords once for the whole batch of paragraphs
+    claim_keywords = extract_keywords(claim_text)
+
     for para in paragraphs:
         para_text = para.get("text", "")
-        overlap = calculate_keyword_overlap(claim_text, para_text)
+        overlap = _overlap_with_keywords(claim_keywords, para_text)
 
         if overlap >= threshold:
             matches.append(
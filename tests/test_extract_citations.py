@@ -0,0 +1,45 @@
+"""
+Tests for scripts/extract_citations.py
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from extract_citations import CITATION_PATTERNS, extract_citations_from_text
+
+
+SAMPLE_TEXT = (
+    "In Montgomery v Lanarkshire Health Board [2015] UKSC 11 the court departed "
+    "from Sidaway v Bethlem Royal Hospital [1985] 1 AC 871. See also "
+    "[2020] EWCA Civ 100 and (1990) 1 WLR 20."
+)
+
+
+@pytest.mark.unit
+def test_extract_citations_single_pass_matches_per_pattern_scan():
+    """Test the unioned regex finds the same citations as one scan per pattern."""
+    combined = extract_citations_from_text(SAMPLE_TEXT)
+    per_pattern = extract_citations_from_text(SAMPLE_TEXT, patterns=dict(CITATION_PATTERNS))
+
+    assert combined == per_pattern
+
+
+@pytest.mark.unit
+def test_extract_citations_reports_pattern_and_order():
+    """Test citations are ordered by position and tagged with their pattern."""
+    citations = extract_citations_from_text(SAMPLE_TEXT)
+
+    assert [c["pattern_matched"] for c in citations] == [
+        "case_name",
+        "uk_neutral_citation",
+        "case_name",
+        "law_report",
+        "ew_neutral_citation",
+        "year_volume_report",
+    ]
+    assert [c["citation_id"] for c in citations] == [f"cit_{i}" for i in range(1, 7)]
+    assert citations[1]["text"] == "[2015] UKSC 11"
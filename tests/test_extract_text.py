@@ -9,7 +9,8 @@ import sys
 # Add scripts to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
-from extract_text import extract_text_from_txt, extract_text_from_document
+import extract_text
+from extract_text import extract_text_from_html, extract_text_from_txt, extract_text_from_document
 
 
 @pytest.mark.unit
@@ -28,6 +29,20 @@ def test_extract_text_from_txt_success(temp_workspace, tmp_path):
     assert result["extraction_method"] == "plain_text"
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize("html", ["", "   \n", "<!-- x -->"])
+def test_extract_text_from_html_empty_document(tmp_path, html):
+    """Test empty, whitespace-only and comment-only HTML give empty text."""
+    pytest.importorskip("lxml")
+    test_file = tmp_path / "empty.html"
+    test_file.write_text(html, encoding="utf-8")
+
+    result = extract_text_from_html(test_file)
+
+    assert result["text"] == ""
+    assert result["char_count"] == 0
+
+
 @pytest.mark.unit
 def test_extract_text_from_document_txt(temp_workspace, tmp_path):
     """Test full extraction workflow for TXT document."""
@@ -77,6 +92,19 @@ def test_extract_text_invalid_type(temp_workspace, tmp_path):
         )
 
 
+@pytest.mark.unit
+def test_extract_text_rejects_oversized_document(temp_workspace, tmp_path, monkeypatch):
+    """Test documents above the size limit are rejected before parsing."""
+    test_file = tmp_path / "large.txt"
+    test_file.write_text("x" * 64)
+    monkeypatch.setattr(extract_text, "MAX_DOCUMENT_BYTES", 32)
+
+    with pytest.raises(ValueError, match="Document too large"):
+        extract_text_from_document(
+            job_id="test_job", doc_id="doc_1", doc_path=test_file, doc_type="txt"
+        )
+
+
 @pytest.mark.unit
 def test_extract_text_deterministic(temp_workspace, tmp_path):
     """Test that extraction is deterministic (same input = same output)."""
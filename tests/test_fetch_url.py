@@ -0,0 +1,94 @@
+"""
+Tests for scripts/fetch_url.py
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import fetch_url
+from fetch_url import fetch_and_cache_url
+
+requests = pytest.importorskip("requests")
+
+URL = "https://www.bailii.org/uk/cases/UKSC/2023/1.html"
+
+
+class StreamingResponse:
+    """Streaming response whose body can fail part-way through."""
+
+    def __init__(self, chunks, fail_after=None):
+        self.status_code = 200
+        self.headers = {"Content-Type": "text/html; charset=utf-8"}
+        self.history = []
+        self.url = URL
+        self._chunks = chunks
+        self._fail_after = fail_after
+
+    def iter_content(self, chunk_size=None):
+        for i, chunk in enumerate(self._chunks):
+            if i == self._fail_after:
+                raise requests.exceptions.ChunkedEncodingError("connection reset mid-body")
+            yield chunk
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self._responses = iter(responses)
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        return next(self._responses)
+
+
+@pytest.fixture
+def no_waiting(monkeypatch):
+    monkeypatch.setattr(fetch_url, "rate_limit_wait", lambda url, rate_limit_ms=None: None)
+    monkeypatch.setattr(fetch_url.time, "sleep", lambda seconds: None)
+
+
+@pytest.mark.unit
+def test_fetch_retries_body_failure_mid_stream(temp_workspace, tmp_path, monkeypatch, no_waiting):
+    """Test a connection drop while streaming the body is retried and leaves no partial file."""
+    session = FakeSession([
+        StreamingResponse([b"<html>partial", b" body"], fail_after=1),
+        StreamingResponse([b"<html>full", b" body</html>"]),
+    ])
+    monkeypatch.setattr(fetch_url, "get_session", lambda: session)
+
+    result = fetch_and_cache_url(job_id="test_job", url=URL)
+
+    assert session.calls == 2
+    assert result["fetch_status"] == "success"
+    cache_path = Path(result["cache_path"])
+    assert cache_path.read_bytes() == b"<html>full body</html>"
+    assert not list(cache_path.parent.glob("*.part"))
+
+
+@pytest.mark.unit
+def test_fetch_reports_error_when_body_keeps_failing(temp_workspace, tmp_path, monkeypatch, no_waiting):
+    """Test repeated mid-stream failures give an error result, not an exception."""
+    session = FakeSession([
+        StreamingResponse([b"<html>", b"..."], fail_after=1) for _ in range(3)
+    ])
+    monkeypatch.setattr(fetch_url, "get_session", lambda: session)
+
+    result = fetch_and_cache_url(job_id="test_job", url=URL)
+
+    assert session.calls == 3
+    assert result["fetch_status"] == "error"
+    assert result["status_code"] == 0
+    assert not list(Path("sources", "test_job").glob("*.part"))
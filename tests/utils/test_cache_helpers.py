@@ -0,0 +1,39 @@
+"""
+Tests for scripts/utils/cache_helpers.py
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from utils.cache_helpers import TTLCache
+
+
+@pytest.mark.unit
+def test_ttl_cache_evicts_least_recently_used():
+    """Test the oldest untouched entry is dropped once maxsize is exceeded."""
+    cache = TTLCache(maxsize=2, ttl_sec=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+@pytest.mark.unit
+def test_ttl_cache_expires_entries_and_keeps_falsy_values():
+    """Test expired entries miss and falsy values are distinguishable from misses."""
+    cache = TTLCache(maxsize=4, ttl_sec=60)
+    cache.set("missing", False)
+    assert cache.get("missing", "miss") is False
+
+    expired = TTLCache(maxsize=4, ttl_sec=0)
+    expired.set("key", True)
+    assert expired.get("key", "miss") == "miss"
+    assert len(expired) == 0